@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Technology, Project, BlogPost, Tag, Skill, Contact
+from .models import Technology, Project, ProjectScreenshot, BlogPost, Tag, Skill, Contact
 
 @admin.register(Technology)
 class TechnologyAdmin(admin.ModelAdmin):
@@ -8,6 +8,13 @@ class TechnologyAdmin(admin.ModelAdmin):
     search_fields = ['name']
     ordering = ['category', 'name']
 
+class ProjectScreenshotInline(admin.TabularInline):
+    model = ProjectScreenshot
+    fields = ['image', 'url', 'caption', 'position', 'width', 'height']
+    readonly_fields = ['width', 'height']
+    extra = 1
+    ordering = ['position', 'id']
+
 @admin.register(Project)
 class ProjectAdmin(admin.ModelAdmin):
     list_display = ['title', 'status', 'priority', 'featured', 'created_date']
@@ -16,6 +23,7 @@ class ProjectAdmin(admin.ModelAdmin):
     prepopulated_fields = {'slug': ('title',)}
     filter_horizontal = ['technologies']
     ordering = ['-priority', '-created_date']
+    inlines = [ProjectScreenshotInline]
 
 @admin.register(BlogPost)
 class BlogPostAdmin(admin.ModelAdmin):
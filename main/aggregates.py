@@ -0,0 +1,54 @@
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from .cache import get_cache
+from .models import BlogPost, Tag, Technology
+
+CATEGORY_SUMMARY_KEY = 'blog-category-summary'
+
+
+def recount(queryset, field, actual):
+    """Store the `actual` aggregate in `field` on rows where it has drifted
+
+    Only changed rows are written (with a fresh updated_date, so API ETags
+    change with the count), in one bulk UPDATE. Returns how many changed.
+    """
+    stale = []
+    now = timezone.now()
+    for obj in queryset.annotate(actual=actual).only('pk', field):
+        if getattr(obj, field) != obj.actual:
+            setattr(obj, field, obj.actual)
+            obj.updated_date = now
+            stale.append(obj)
+    queryset.model.objects.bulk_update(stale, [field, 'updated_date'], batch_size=500)
+    return len(stale)
+
+
+def recount_technologies(ids=None):
+    """Refresh Technology.project_count for `ids` (every technology if None)"""
+    queryset = Technology.objects.all() if ids is None else Technology.objects.filter(pk__in=ids)
+    return recount(queryset, 'project_count', Count('projects', distinct=True))
+
+
+def recount_tags(ids=None):
+    """Refresh Tag.post_count (published posts) for `ids` (every tag if None)"""
+    queryset = Tag.objects.all() if ids is None else Tag.objects.filter(pk__in=ids)
+    return recount(
+        queryset, 'post_count', Count('blog_posts', filter=Q(blog_posts__published=True), distinct=True)
+    )
+
+
+def category_summary():
+    """{category: published post count}, cached until a post is saved or deleted"""
+    cache = get_cache()
+    summary = cache.get(CATEGORY_SUMMARY_KEY)
+    if summary is None:
+        summary = dict(
+            BlogPost.objects.published().order_by('category').values_list('category').annotate(count=Count('pk'))
+        )
+        cache.set(CATEGORY_SUMMARY_KEY, summary, timeout=None)
+    return summary
+
+
+def invalidate_category_summary():
+    get_cache().delete(CATEGORY_SUMMARY_KEY)
@@ -1,26 +1,55 @@
 # Create this file: main/api_urls.py
 
+from django.conf import settings
 from django.urls import path
 from . import api_views
+from .async_api_views import async_view
+from .sessions import sessionless
+
+
+def read_view(view_class, async_views=None):
+    """Read-only endpoints run as async views when ASYNC_API is on, never using the session"""
+    if async_views is None:
+        async_views = settings.ASYNC_API
+    if async_views:
+        return sessionless(async_view(view_class))
+    return sessionless(view_class.as_view())
+
+
+def read_urlpatterns(async_views=None):
+    """Routes for the read-only endpoints, as sync DRF views or their async twins"""
+    return [
+        # Projects
+        path('projects/', read_view(api_views.ProjectListAPIView, async_views), name='api_project_list'),
+        path('projects/<slug:slug>/', read_view(api_views.ProjectDetailAPIView, async_views), name='api_project_detail'),
+        
+        # Technologies
+        path('technologies/', read_view(api_views.TechnologyListAPIView, async_views), name='api_technology_list'),
+        
+        # Blog
+        path('blog/', read_view(api_views.BlogPostListAPIView, async_views), name='api_blog_list'),
+        path('blog/<slug:slug>/', read_view(api_views.BlogPostDetailAPIView, async_views), name='api_blog_detail'),
+        
+        # Skills
+        path('skills/', read_view(api_views.SkillListAPIView, async_views), name='api_skill_list'),
+    ]
+
 
 urlpatterns = [
     # API Root
     path('', api_views.api_root, name='api_root'),
     
-    # Projects
-    path('projects/', api_views.ProjectListAPIView.as_view(), name='api_project_list'),
-    path('projects/<slug:slug>/', api_views.ProjectDetailAPIView.as_view(), name='api_project_detail'),
-    
-    # Technologies
-    path('technologies/', api_views.TechnologyListAPIView.as_view(), name='api_technology_list'),
+    # Projects, technologies, blog and skills
+    *read_urlpatterns(),
     
-    # Blog
-    path('blog/', api_views.BlogPostListAPIView.as_view(), name='api_blog_list'),
-    path('blog/<slug:slug>/', api_views.BlogPostDetailAPIView.as_view(), name='api_blog_detail'),
-    
-    # Skills
-    path('skills/', api_views.SkillListAPIView.as_view(), name='api_skill_list'),
+    # All of the above in one cached document
+    path('snapshot/', sessionless(api_views.snapshot_view), name='api_snapshot'),
     
     # Contact
     path('contact/', api_views.ContactCreateAPIView.as_view(), name='api_contact_create'),
-]
\ No newline at end of file
+    
+    # Monitoring
+    path('cache-stats/', api_views.cache_stats_view, name='api_cache_stats'),
+    path('performance/', api_views.performance_view, name='api_performance'),
+    path('db-stats/', api_views.db_stats_view, name='api_db_stats'),
+]
@@ -2,23 +2,85 @@
 
 from rest_framework import generics, status
 from rest_framework.response import Response
-from rest_framework.decorators import api_view
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAdminUser
 from django.shortcuts import get_object_or_404
-from .models import Project, Technology, BlogPost, Skill, Contact
+from django.db.models import Sum
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.views.decorators.http import require_safe
+from .cache import cache_stats
+from .conditional import ConditionalGetMixin
+from .contact_queue import contact_queue
+from .fieldsets import Fieldset
+from .instrumentation import connection_stats, performance_stats
+from .models import Project, Technology, BlogPost, Skill, Contact, Tag
+from .snapshot import get_snapshot, preferred_encoding
+from .row_serializers import (
+    BlogPostListRowSerializer, ProjectListRowSerializer, SkillRowSerializer, TechnologyRowSerializer
+)
+from .throttling import ContactRateThrottle
 from .serializers import (
     ProjectSerializer, ProjectListSerializer, TechnologySerializer,
     BlogPostSerializer, BlogPostListSerializer, SkillSerializer,
     ContactSerializer
 )
 
+class SparseFieldsMixin:
+    """?fields= and ?expand= for read views, narrowing both the payload and the query"""
+    
+    @property
+    def fieldset(self):
+        if not hasattr(self, '_fieldset'):
+            self._fieldset = Fieldset.from_request(self.request, self.get_serializer_class())
+        return self._fieldset
+    
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['fieldset'] = self.fieldset
+        return context
+    
+    def filter_queryset(self, queryset):
+        return self.fieldset.narrow(super().filter_queryset(queryset))
+
+class RowListMixin:
+    """list() through `row_serializer_class`: values() rows instead of model instances
+    
+    `serializer_class` stays the ModelSerializer the output mirrors (and
+    what the browsable API describes).
+    """
+    row_serializer_class = None
+    
+    def get_row_serializer(self):
+        return self.row_serializer_class(context=self.get_serializer_context())
+    
+    def get_row_queryset(self, row_serializer):
+        queryset = self.filter_queryset(self.get_queryset())
+        # Keyset pagination reads each page's position from its first/last row
+        keys = []
+        if self.paginator is not None and hasattr(self.paginator, 'get_ordering'):
+            keys = [field for field, _ in self.paginator.get_ordering(self, queryset)]
+        return row_serializer.rows(queryset, keys)
+    
+    def list(self, request, *args, **kwargs):
+        row_serializer = self.get_row_serializer()
+        queryset = self.get_row_queryset(row_serializer)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(row_serializer.serialize(page))
+        return Response(row_serializer.serialize(queryset))
+
 # ===== PROJECT API VIEWS =====
 
-class ProjectListAPIView(generics.ListAPIView):
+class ProjectListAPIView(ConditionalGetMixin, SparseFieldsMixin, RowListMixin, generics.ListAPIView):
     """GET /api/projects/ - List all projects"""
     serializer_class = ProjectListSerializer
+    row_serializer_class = ProjectListRowSerializer
+    validator_related_models = [Technology]
+    cache_control = {'public': True, 'max_age': 300}
     
     def get_queryset(self):
-        queryset = Project.objects.all()
+        queryset = Project.objects.for_listing()
         
         # Filter by featured projects
         featured = self.request.query_params.get('featured')
@@ -28,27 +90,31 @@ class ProjectListAPIView(generics.ListAPIView):
         # Filter by technology
         technology = self.request.query_params.get('technology')
         if technology:
-            queryset = queryset.filter(technologies__name__icontains=technology)
+            queryset = queryset.filter(technologies__name__icontains=technology).distinct()
             
         # Filter by status
         status_filter = self.request.query_params.get('status')
         if status_filter:
             queryset = queryset.filter(status=status_filter)
             
-        return queryset.distinct()
+        return queryset
 
-class ProjectDetailAPIView(generics.RetrieveAPIView):
+class ProjectDetailAPIView(ConditionalGetMixin, SparseFieldsMixin, generics.RetrieveAPIView):
     """GET /api/projects/{slug}/ - Get single project details"""
-    queryset = Project.objects.all()
+    queryset = Project.objects.for_detail()
     serializer_class = ProjectSerializer
     lookup_field = 'slug'
+    validator_related_models = [Technology]
+    cache_control = {'public': True, 'max_age': 300}
 
 # ===== TECHNOLOGY API VIEWS =====
 
-class TechnologyListAPIView(generics.ListAPIView):
+class TechnologyListAPIView(ConditionalGetMixin, SparseFieldsMixin, RowListMixin, generics.ListAPIView):
     """GET /api/technologies/ - List all technologies"""
     queryset = Technology.objects.all()
     serializer_class = TechnologySerializer
+    row_serializer_class = TechnologyRowSerializer
+    cache_control = {'public': True, 'max_age': 3600}
     
     def get_queryset(self):
         queryset = Technology.objects.all()
@@ -62,12 +128,17 @@ class TechnologyListAPIView(generics.ListAPIView):
 
 # ===== BLOG API VIEWS =====
 
-class BlogPostListAPIView(generics.ListAPIView):
+class BlogPostListAPIView(ConditionalGetMixin, SparseFieldsMixin, RowListMixin, generics.ListAPIView):
     """GET /api/blog/ - List published blog posts"""
     serializer_class = BlogPostListSerializer
+    row_serializer_class = BlogPostListRowSerializer
+    validator_related_models = [Tag]
+    # View counts are part of the payload, so revalidate more often
+    validator_extra_aggregates = {'views': Sum('views')}
+    cache_control = {'public': True, 'max_age': 60}
     
     def get_queryset(self):
-        queryset = BlogPost.objects.filter(published=True)
+        queryset = BlogPost.objects.published().with_tags().without_bodies()
         
         # Filter by category
         category = self.request.query_params.get('category')
@@ -76,17 +147,22 @@ class BlogPostListAPIView(generics.ListAPIView):
             
         return queryset
 
-class BlogPostDetailAPIView(generics.RetrieveAPIView):
+class BlogPostDetailAPIView(ConditionalGetMixin, SparseFieldsMixin, generics.RetrieveAPIView):
     """GET /api/blog/{slug}/ - Get single blog post"""
-    queryset = BlogPost.objects.filter(published=True)
+    queryset = BlogPost.objects.published().for_detail()
     serializer_class = BlogPostSerializer
     lookup_field = 'slug'
+    validator_related_models = [Tag, Technology]
+    validator_extra_aggregates = {'views': Sum('views')}
+    cache_control = {'public': True, 'max_age': 60}
 
 # ===== SKILLS API VIEWS =====
 
-class SkillListAPIView(generics.ListAPIView):
+class SkillListAPIView(ConditionalGetMixin, SparseFieldsMixin, RowListMixin, generics.ListAPIView):
     """GET /api/skills/ - List skills"""
     serializer_class = SkillSerializer
+    row_serializer_class = SkillRowSerializer
+    cache_control = {'public': True, 'max_age': 3600}
     
     def get_queryset(self):
         queryset = Skill.objects.filter(show_on_resume=True)
@@ -104,6 +180,11 @@ class ContactCreateAPIView(generics.CreateAPIView):
     """POST /api/contact/ - Submit contact form"""
     queryset = Contact.objects.all()
     serializer_class = ContactSerializer
+    throttle_classes = [ContactRateThrottle]
+    
+    def perform_create(self, serializer):
+        # Buffered and saved in batches; notifications run off the request path
+        contact_queue.submit(**serializer.validated_data)
     
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -115,6 +196,30 @@ class ContactCreateAPIView(generics.CreateAPIView):
             status=status.HTTP_201_CREATED
         )
 
+# ===== SNAPSHOT VIEW =====
+
+@require_safe
+def snapshot_view(request):
+    """GET /api/snapshot/ - Projects, technologies, blog posts and skills in one document
+    
+    Built once per content change and kept compressed in the cache. The
+    ETag is the document's version, so clients revalidate with
+    If-None-Match and only download it again after an edit.
+    """
+    version, encoded = get_snapshot()
+    # Weak, since the gzip/br/identity bodies differ byte-wise
+    etag = f'W/"{version}"'
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        encoding = preferred_encoding(request, encoded)
+        response = HttpResponse(encoded[encoding], content_type='application/json')
+        if encoding != 'identity':
+            response['Content-Encoding'] = encoding
+    response['ETag'] = etag
+    patch_vary_headers(response, ['Accept-Encoding'])
+    patch_cache_control(response, public=True, max_age=60)
+    return response
+
 # ===== API ROOT VIEW =====
 
 @api_view(['GET'])
@@ -129,6 +234,7 @@ def api_root(request):
             'blog': '/api/blog/',
             'blog_detail': '/api/blog/{slug}/',
             'skills': '/api/skills/',
+            'snapshot': '/api/snapshot/',
             'contact': '/api/contact/',
         },
         'filters': {
@@ -136,5 +242,27 @@ def api_root(request):
             'technologies': '?category=frontend',
             'blog': '?category=learning',
             'skills': '?category=programming'
-        }
-    })
\ No newline at end of file
+        },
+        'pagination': 'List endpoints return {next, previous, results}; ?page_size= (max 100), follow next/previous for further pages',
+        'fieldsets': '?fields=id,slug,tags returns just those fields; ?expand=tags embeds the listed relations and returns the others as ids (default: embed all)'
+    })
+
+# ===== MONITORING API VIEWS =====
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def cache_stats_view(request):
+    """GET /api/cache-stats/ - Page/fragment cache hit rates for this worker (staff only)"""
+    return Response(cache_stats.snapshot())
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def performance_view(request):
+    """GET /api/performance/ - Latency/DB/template percentiles per URL name for this worker (staff only)"""
+    return Response(performance_stats.snapshot())
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def db_stats_view(request):
+    """GET /api/db-stats/ - Connection reuse and pool settings for this worker (staff only)"""
+    return Response(connection_stats.snapshot())
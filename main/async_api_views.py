@@ -0,0 +1,103 @@
+from asgiref.sync import sync_to_async
+from django.http import Http404, HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.views import View
+from rest_framework import generics
+
+from .renderers import FastJSONRenderer
+
+
+class AsyncReadAPIView(View):
+    """Native async twin of a read-only DRF list/detail view
+
+    Filtering, serializers, pagination and validators all come from
+    `api_view`; only the database round trips change, going through the
+    async ORM so an ASGI worker keeps serving other requests while it
+    waits. Authentication, permissions and throttles run as in the sync
+    view. Responses are JSON; a request negotiating another renderer (the
+    browsable API) is served by the sync view instead.
+    """
+
+    api_view = None
+    http_method_names = ['get', 'head', 'options']
+
+    def setup(self, request, *args, **kwargs):
+        super().setup(request, *args, **kwargs)
+        # The same Request the DRF view would build (parsers, authenticators,
+        # negotiator); no I/O happens until authentication in initial()
+        self.drf_view = view = self.api_view(args=args, kwargs=kwargs)
+        view.format_kwarg = view.get_format_suffix(**kwargs)
+        view.request = view.initialize_request(request, *args, **kwargs)
+        view.headers = view.default_response_headers
+
+    async def get(self, request, *args, **kwargs):
+        view = self.drf_view
+        try:
+            renderer, _ = view.perform_content_negotiation(view.request)
+            if renderer.format != 'json':
+                return await sync_to_async(self.api_view.as_view())(request, *args, **kwargs)
+            # Authentication may load the user from the session, so it runs in a thread
+            await sync_to_async(view.initial)(view.request, *args, **kwargs)
+            etag, last_modified = view.validators_for(request, await view.aget_validator_state())
+            response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+            if response is None:
+                response = self.render(await self.get_data())
+        except Exception as exc:
+            return self.finalize(self.handle_exception(exc))
+        return self.finalize(view.apply_validators(response, etag, last_modified))
+
+    def handle_exception(self, exc):
+        """The error response the sync view would send, re-rendered as JSON
+
+        APIView.handle_exception turns NotAuthenticated into a 403 where no
+        authenticate header applies, runs the configured EXCEPTION_HANDLER
+        and re-raises anything it doesn't handle.
+        """
+        response = self.drf_view.handle_exception(exc)
+        headers = {name: value for name, value in response.items() if name != 'Content-Type'}
+        return self.render(response.data, status=response.status_code, headers=headers)
+
+    def finalize(self, response):
+        """Add the headers APIView.finalize_response would (Allow, Vary: Accept)"""
+        for name, value in self.drf_view.headers.items():
+            if name == 'Vary':
+                patch_vary_headers(response, [value])
+            else:
+                response[name] = value
+        return response
+
+    async def get_data(self):
+        view = self.drf_view
+        queryset = view.filter_queryset(view.get_queryset())
+        if issubclass(self.api_view, generics.RetrieveAPIView):
+            lookup = {view.lookup_field: view.kwargs[view.lookup_field]}
+            try:
+                instance = await queryset.aget(**lookup)
+            except queryset.model.DoesNotExist:
+                # As get_object_or_404 does, so the handler sends the same body
+                raise Http404(f'No {queryset.model._meta.object_name} matches the given query.')
+            return view.get_serializer(instance).data
+
+        paginator = view.paginator
+        if getattr(view, 'row_serializer_class', None) is not None:
+            row_serializer = view.get_row_serializer()
+            queryset = view.get_row_queryset(row_serializer)
+            if paginator is None:
+                return await row_serializer.aserialize([row async for row in queryset])
+            page = await paginator.apaginate_queryset(queryset, view.request, view=view)
+            return paginator.get_paginated_response(await row_serializer.aserialize(page)).data
+        if paginator is None:
+            return view.get_serializer([row async for row in queryset], many=True).data
+        page = await paginator.apaginate_queryset(queryset, view.request, view=view)
+        return paginator.get_paginated_response(view.get_serializer(page, many=True).data).data
+
+    @staticmethod
+    def render(data, status=200, headers=None):
+        return HttpResponse(
+            FastJSONRenderer().render(data), content_type='application/json', status=status, headers=headers
+        )
+
+
+def async_view(api_view):
+    """URL view function serving `api_view` through AsyncReadAPIView"""
+    return AsyncReadAPIView.as_view(api_view=api_view)
@@ -0,0 +1,109 @@
+import hashlib
+import threading
+import time
+from collections import Counter
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+
+CONTENT_VERSION_KEY = 'content-version'
+
+
+def get_cache():
+    return caches[getattr(settings, 'CONTENT_CACHE_ALIAS', 'default')]
+
+
+def get_timeout():
+    return getattr(settings, 'CONTENT_CACHE_TIMEOUT', 600)
+
+
+class CacheStats:
+    """Hit/miss counters per cache namespace ('page', 'fragment')
+
+    Counts are per process; each worker reports its own.
+    """
+
+    def __init__(self):
+        self._counts = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, namespace, hit):
+        with self._lock:
+            self._counts[(namespace, 'hits' if hit else 'misses')] += 1
+
+    def snapshot(self):
+        with self._lock:
+            counts = dict(self._counts)
+        stats = {}
+        for (namespace, outcome), count in counts.items():
+            stats.setdefault(namespace, {'hits': 0, 'misses': 0})[outcome] = count
+        for values in stats.values():
+            total = values['hits'] + values['misses']
+            values['hit_rate'] = round(values['hits'] / total, 4) if total else 0.0
+        return stats
+
+    def reset(self):
+        with self._lock:
+            self._counts.clear()
+
+
+cache_stats = CacheStats()
+
+
+def content_version():
+    """Current content generation; every cached page/fragment key includes it
+
+    If the key has been evicted it restarts from the current time, so it
+    can never fall back to a generation that still has entries cached.
+    """
+    cache = get_cache()
+    version = cache.get(CONTENT_VERSION_KEY)
+    if version is None:
+        version = time.time_ns()
+        if not cache.add(CONTENT_VERSION_KEY, version, timeout=None):
+            version = cache.get(CONTENT_VERSION_KEY, version)
+    return version
+
+
+def invalidate_content():
+    """Start a new content generation, orphaning every cached page and fragment"""
+    cache = get_cache()
+    try:
+        cache.incr(CONTENT_VERSION_KEY)
+    except ValueError:
+        cache.set(CONTENT_VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def make_key(namespace, *parts):
+    digest = hashlib.md5(':'.join(str(part) for part in parts).encode()).hexdigest()
+    return f'{namespace}:{content_version()}:{digest}'
+
+
+def cache_content_page(view):
+    """Cache anonymous GET responses until content changes or the timeout passes"""
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        if request.method != 'GET' or request.user.is_authenticated:
+            return view(request, *args, **kwargs)
+
+        cache = get_cache()
+        key = make_key('page', request.get_full_path())
+        cached = cache.get(key)
+        if cached is not None:
+            cache_stats.record('page', hit=True)
+            content, content_type = cached
+            response = HttpResponse(content, content_type=content_type)
+            response['X-Cache'] = 'HIT'
+            return response
+
+        cache_stats.record('page', hit=False)
+        response = view(request, *args, **kwargs)
+        if response.status_code == 200 and not response.streaming and not response.cookies:
+            cache.set(key, (response.content, response['Content-Type']), get_timeout())
+        response['X-Cache'] = 'MISS'
+        return response
+
+    return wrapper
@@ -0,0 +1,58 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.checks import Error, Tags, Warning, register
+
+MANIFEST_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+LOCMEM_CACHE = 'django.core.cache.backends.locmem.LocMemCache'
+
+
+@register('static_manifest')
+def check_static_manifest(app_configs, **kwargs):
+    """Production static mode is only fast (and working) after collectstatic
+
+    Tagged outside 'staticfiles' so collectstatic itself isn't blocked by
+    the manifest it is about to write; `migrate` and `check` run it.
+    """
+    if settings.STORAGES['staticfiles']['BACKEND'] != MANIFEST_STORAGE:
+        return []
+    errors = []
+    manifest = Path(settings.STATIC_ROOT) / 'staticfiles.json'
+    if not manifest.exists():
+        errors.append(Error(
+            f'{manifest} is missing; every {{% static %}} lookup would fail.',
+            hint='Run `manage.py collectstatic --noinput` before starting the server.',
+            id='main.E001',
+        ))
+    if settings.WHITENOISE_USE_FINDERS or settings.WHITENOISE_AUTOREFRESH:
+        errors.append(Warning(
+            'WHITENOISE_USE_FINDERS/WHITENOISE_AUTOREFRESH re-scan static files per request.',
+            hint='Leave both off when STATIC_MANIFEST is on.',
+            id='main.W001',
+        ))
+    try:
+        import brotli  # noqa: F401
+    except ImportError:
+        errors.append(Warning(
+            'Brotli is not installed, so collectstatic only writes gzip variants.',
+            hint='pip install Brotli',
+            id='main.W002',
+        ))
+    return errors
+
+
+@register(Tags.caches)
+def check_shared_cache(app_configs, **kwargs):
+    """Cached pages are invalidated through the cache, so every worker must share it
+
+    With LocMemCache each process has its own copy of the content version,
+    and an admin edit only reaches the worker that handled it.
+    """
+    if settings.WEB_CONCURRENCY > 1 and settings.CACHES['default']['BACKEND'] == LOCMEM_CACHE:
+        return [Error(
+            f'LocMemCache is per process, but WEB_CONCURRENCY is {settings.WEB_CONCURRENCY}; '
+            'other workers would keep serving stale pages after an edit.',
+            hint='Use the database cache (the default with several workers) or Redis via CACHE_BACKEND.',
+            id='main.E002',
+        )]
+    return []
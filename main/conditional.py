@@ -0,0 +1,81 @@
+import hashlib
+
+from django.db.models import Count, Max, Subquery, Value
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+
+class ConditionalGetMixin:
+    """ETag/Last-Modified support for read-only DRF views
+
+    Validators come from a single aggregate query over the view's queryset
+    and the tables in `validator_related_models`, so a request that ends
+    in 304 costs one query and never runs the serializer.
+    """
+
+    cache_control = {'public': True, 'max_age': 60}
+    validator_related_models = []
+    validator_extra_aggregates = {}
+
+    def get_validator_query(self):
+        """The queryset and aggregates whose values change whenever the response body would"""
+        queryset = self.get_queryset().order_by()
+        if getattr(self, 'lookup_field', None) and self.lookup_field in self.kwargs:
+            queryset = queryset.filter(**{self.lookup_field: self.kwargs[self.lookup_field]})
+        aggregates = {
+            'count': Count('pk'),
+            'max_pk': Max('pk'),
+            'last_modified': Max('updated_date'),
+        }
+        aggregates.update(self.validator_extra_aggregates)
+        # Related tables ride along as scalar subqueries in the same statement
+        for model in self.validator_related_models:
+            related = model.objects.order_by().annotate(group=Value(1)).values('group')
+            aggregates[f'{model.__name__}_count'] = Max(
+                Subquery(related.annotate(value=Count('pk')).values('value'))
+            )
+            aggregates[f'{model.__name__}_last_modified'] = Max(
+                Subquery(related.annotate(value=Max('updated_date')).values('value'))
+            )
+        return queryset, aggregates
+
+    def merge_validator_state(self, state):
+        for model in self.validator_related_models:
+            related_last_modified = state[f'{model.__name__}_last_modified']
+            if related_last_modified and (
+                state['last_modified'] is None or related_last_modified > state['last_modified']
+            ):
+                state['last_modified'] = related_last_modified
+        return state
+
+    def get_validator_state(self):
+        queryset, aggregates = self.get_validator_query()
+        return self.merge_validator_state(queryset.aggregate(**aggregates))
+
+    async def aget_validator_state(self):
+        queryset, aggregates = self.get_validator_query()
+        return self.merge_validator_state(await queryset.aaggregate(**aggregates))
+
+    def validators_for(self, request, state):
+        fingerprint = repr((request.get_full_path(), sorted(state.items(), key=lambda item: item[0])))
+        etag = '"%s"' % hashlib.md5(fingerprint.encode()).hexdigest()
+        last_modified = state['last_modified']
+        return etag, last_modified and int(last_modified.timestamp())
+
+    def get_validators(self, request):
+        return self.validators_for(request, self.get_validator_state())
+
+    def apply_validators(self, response, etag, last_modified):
+        if 200 <= response.status_code < 300 or response.status_code == 304:
+            response['ETag'] = etag
+            if last_modified:
+                response['Last-Modified'] = http_date(last_modified)
+            patch_cache_control(response, **self.cache_control)
+        return response
+
+    def get(self, request, *args, **kwargs):
+        etag, last_modified = self.get_validators(request)
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+        return self.apply_validators(response, etag, last_modified)
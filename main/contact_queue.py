@@ -0,0 +1,136 @@
+import atexit
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.dispatch import Signal
+
+from .models import Contact
+
+logger = logging.getLogger(__name__)
+
+# Sent with `contacts` (saved Contact instances) after every batch is written.
+# Connect email/notification handlers here; they run off the request path.
+contacts_received = Signal()
+
+
+class ContactQueue:
+    """Write-behind buffer for contact submissions
+
+    submit() only appends to an in-memory list. The buffer is written with
+    one bulk_create once it holds CONTACT_QUEUE_BATCH_SIZE submissions, when
+    CONTACT_QUEUE_FLUSH_INTERVAL seconds have passed, or at exit (gunicorn
+    workers also flush on SIGTERM, see portfolio/gunicorn_asgi.py), so a
+    burst of POSTs costs a handful of INSERTs. With CONTACT_QUEUE_BACKGROUND on,
+    a timer flushes stragglers and `contacts_received` receivers run on a
+    worker thread; otherwise both happen inline.
+    """
+
+    def __init__(self, model=Contact):
+        self.model = model
+        self._pending = []
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._timer = None
+        self._executor = None
+
+    @property
+    def batch_size(self):
+        return getattr(settings, 'CONTACT_QUEUE_BATCH_SIZE', 20)
+
+    @property
+    def flush_interval(self):
+        return getattr(settings, 'CONTACT_QUEUE_FLUSH_INTERVAL', 5)
+
+    @property
+    def background(self):
+        return getattr(settings, 'CONTACT_QUEUE_BACKGROUND', True)
+
+    def submit(self, **fields):
+        """Buffer one submission (already validated); returns the unsaved instance"""
+        contact = self.model(**fields)
+        with self._lock:
+            self._pending.append(contact)
+            due = (
+                len(self._pending) >= self.batch_size
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            )
+            if not due and self.background and self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self._flush_in_background)
+                self._timer.daemon = True
+                self._timer.start()
+        if due:
+            try:
+                self.flush()
+            except Exception:
+                pass  # already logged; the submission stays buffered for the next flush
+        return contact
+
+    def pending(self):
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self):
+        """Save every buffered submission in one INSERT, returning how many were saved"""
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self._last_flush = time.monotonic()
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if not pending:
+            return 0
+
+        try:
+            with transaction.atomic():
+                saved = self.model._default_manager.bulk_create(pending)
+        except Exception:
+            # Put the submissions back so the next flush retries them
+            logger.exception('Failed to save %d contact submissions', len(pending))
+            with self._lock:
+                self._pending[:0] = pending
+            raise
+        self.notify(saved)
+        return len(saved)
+
+    def notify(self, contacts):
+        if not self.background:
+            self.send(contacts)
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='contact-notify')
+        self._executor.submit(self._in_background, self.send, contacts)
+
+    def send(self, contacts):
+        for receiver, response in contacts_received.send_robust(sender=self.model, contacts=contacts):
+            if isinstance(response, Exception):
+                logger.error('Contact notification handler %r failed', receiver, exc_info=response)
+
+    def _flush_in_background(self):
+        with self._lock:
+            self._timer = None
+        self._in_background(self.flush)
+
+    @staticmethod
+    def _in_background(func, *args):
+        try:
+            func(*args)
+        except Exception:
+            pass  # already logged
+        finally:
+            # This thread's connection would otherwise stay open until it dies
+            connections.close_all()
+
+
+contact_queue = ContactQueue()
+
+
+@atexit.register
+def _flush_on_exit():
+    try:
+        contact_queue.flush()
+    except Exception:
+        pass
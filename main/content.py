@@ -0,0 +1,83 @@
+import math
+import re
+from html import unescape
+
+from django.apps import apps as global_apps
+from django.utils import timezone
+from django.utils.html import linebreaks, strip_tags
+from django.utils.text import Truncator
+
+try:
+    import markdown
+    import nh3
+except ImportError:  # plain paragraphs instead; see render_markdown
+    markdown = nh3 = None
+
+WORDS_PER_MINUTE = 200
+SUMMARY_WORDS = 25
+
+ALLOWED_TAGS = {
+    'a', 'abbr', 'blockquote', 'br', 'code', 'dd', 'del', 'dl', 'dt', 'em', 'h1', 'h2', 'h3',
+    'h4', 'h5', 'h6', 'hr', 'img', 'li', 'ol', 'p', 'pre', 'strong', 'sub', 'sup', 'table',
+    'tbody', 'td', 'th', 'thead', 'tr', 'ul',
+}
+ALLOWED_ATTRIBUTES = {
+    'a': {'href', 'title'},
+    'abbr': {'title'},
+    'img': {'src', 'alt', 'title', 'width', 'height'},
+    'code': {'class'},
+    'th': {'align'},
+    'td': {'align'},
+}
+
+
+def render_markdown(source):
+    """Sanitized HTML for a Markdown `source`
+
+    Single newlines become <br> so existing plain-text posts render as
+    they did with |linebreaks. Without the optional markdown/nh3 packages
+    the text is escaped and wrapped in paragraphs instead.
+    """
+    if markdown is None or nh3 is None:
+        return linebreaks(source, autoescape=True)
+    html = markdown.markdown(source, extensions=['extra', 'sane_lists', 'nl2br'])
+    return nh3.clean(
+        html, tags=ALLOWED_TAGS, attributes=ALLOWED_ATTRIBUTES, link_rel='noopener noreferrer nofollow'
+    )
+
+
+def plain_text(html):
+    return re.sub(r'\s+', ' ', unescape(strip_tags(html))).strip()
+
+
+def render_post(content, excerpt=''):
+    """Every field BlogPost derives from its content, computed once at save time"""
+    html = render_markdown(content)
+    text = plain_text(html)
+    word_count = len(text.split())
+    return {
+        'content_html': html,
+        'summary': excerpt.strip() or Truncator(text).words(SUMMARY_WORDS),
+        'word_count': word_count,
+        'reading_time': max(1, math.ceil(word_count / WORDS_PER_MINUTE)),
+    }
+
+
+def render_all_posts(apps=global_apps, batch_size=200):
+    """Re-render the derived fields of every post, returning how many changed
+
+    Only posts whose rendering changed are written, and their updated_date
+    is bumped so conditional GETs see the new HTML.
+    """
+    BlogPost = apps.get_model('main', 'BlogPost')
+    fields = ['content_html', 'summary', 'word_count', 'reading_time']
+    changed, now = [], timezone.now()
+    for post in BlogPost.objects.only('pk', 'content', 'excerpt', *fields).iterator(chunk_size=batch_size):
+        rendered = render_post(post.content, post.excerpt)
+        if any(getattr(post, field) != value for field, value in rendered.items()):
+            for field, value in rendered.items():
+                setattr(post, field, value)
+            post.updated_date = now
+            changed.append(post)
+    BlogPost.objects.bulk_update(changed, [*fields, 'updated_date'], batch_size=batch_size)
+    return len(changed)
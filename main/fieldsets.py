@@ -0,0 +1,126 @@
+from functools import lru_cache
+
+from django.db.models import Prefetch
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+
+@lru_cache(maxsize=None)
+def serializer_layout(serializer_class):
+    """{field name: (kind, source)} for a ModelSerializer, built once per class
+
+    kind is 'nested' for embedded related objects, 'column' for fields
+    read straight from a model column and 'computed' for the rest.
+    """
+    model = serializer_class.Meta.model
+    columns = {field.name for field in model._meta.concrete_fields}
+    layout = {}
+    for name, field in serializer_class().fields.items():
+        if isinstance(field, serializers.BaseSerializer):
+            layout[name] = ('nested', field.source)
+        elif field.source in columns:
+            layout[name] = ('column', field.source)
+        else:
+            layout[name] = ('computed', field.source)
+    return layout
+
+
+class Fieldset:
+    """The fields (?fields=) and embedded relations (?expand=) a request asked for
+
+    Both take comma-separated top-level field names. Without ?fields=
+    every field is returned; without ?expand= every nested relation is
+    embedded in full, as before. Relations left out of ?expand= come back
+    as lists of ids, and `narrow()` trims the query to match: only the
+    selected columns, id-only prefetches, none for dropped relations.
+    Unknown names are a 400.
+    """
+
+    fields_param = 'fields'
+    expand_param = 'expand'
+
+    def __init__(self, serializer_class, fields=None, expand=None):
+        self.serializer_class = serializer_class
+        self.layout = serializer_layout(serializer_class)
+        nested = [name for name, (kind, _) in self.layout.items() if kind == 'nested']
+        self.sparse = fields is not None
+        self.fields = set(self.parse(self.fields_param, fields, list(self.layout)) if self.sparse else self.layout)
+        self.expanded = set(nested if expand is None else self.parse(self.expand_param, expand, nested))
+
+    @classmethod
+    def from_request(cls, request, serializer_class):
+        # A ?fields= naming nothing (empty, or just commas and spaces) means every
+        # field, as if it were left out; an empty ?expand= embeds nothing
+        params = request.query_params
+        fields = params.get(cls.fields_param, '')
+        if not fields.replace(',', '').strip():
+            fields = None
+        return cls(serializer_class, fields, params.get(cls.expand_param))
+
+    @staticmethod
+    def parse(param, value, allowed):
+        names = [name.strip() for name in value.split(',') if name.strip()]
+        unknown = [name for name in names if name not in allowed]
+        if unknown:
+            raise ValidationError({param: [
+                f"Unknown field(s): {', '.join(unknown)}. Choose from: {', '.join(allowed)}."
+            ]})
+        return names
+
+    def applies_to(self, serializer):
+        # Nested serializers share the root's context but keep all their fields
+        return type(serializer) is self.serializer_class
+
+    def is_nested(self, name):
+        return self.layout[name][0] == 'nested'
+
+    def embeds(self, name):
+        return name in self.expanded
+
+    def apply(self, fields):
+        """Serializer fields narrowed to the selection, unexpanded relations as ids"""
+        selected = {}
+        for name, field in fields.items():
+            if name not in self.fields:
+                continue
+            if self.is_nested(name) and not self.embeds(name):
+                source = {'source': field.source} if field.source and field.source != name else {}
+                field = serializers.PrimaryKeyRelatedField(many=True, read_only=True, **source)
+            selected[name] = field
+        return selected
+
+    def columns(self):
+        """Model columns the selected fields read, or None if that can't be known"""
+        field_columns = getattr(self.serializer_class, 'field_columns', {})
+        columns = ['pk']
+        for name in self.fields:
+            kind, source = self.layout[name]
+            if kind == 'column':
+                columns.append(source)
+            elif kind == 'computed':
+                if name not in field_columns:
+                    return None
+                columns.extend(field_columns[name])
+        return columns
+
+    def narrow(self, queryset):
+        """`queryset` loading just what the selected fields serialize"""
+        if self.sparse or len(self.expanded) < sum(kind == 'nested' for kind, _ in self.layout.values()):
+            lookups = []
+            for name in self.fields:
+                kind, source = self.layout[name]
+                if kind != 'nested':
+                    continue
+                if self.embeds(name):
+                    lookups.append(source)
+                    continue
+                relation = queryset.model._meta.get_field(source)
+                # A reverse foreign key groups prefetched rows by their FK column
+                keys = [relation.field.name] if relation.one_to_many else []
+                lookups.append(Prefetch(source, queryset=relation.related_model._default_manager.only('pk', *keys)))
+            queryset = queryset.prefetch_related(None).prefetch_related(*lookups)
+        columns = self.columns() if self.sparse else None
+        if columns is not None:
+            # API serializers don't follow foreign keys, and only() can't defer a joined one
+            queryset = queryset.select_related(None).only(*columns)
+        return queryset
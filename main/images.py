@@ -0,0 +1,210 @@
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from pathlib import PurePosixPath
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import connections, transaction
+from django.utils import timezone
+from PIL import Image, ImageOps, features
+
+from .cache import invalidate_content
+from .models import Project, ProjectScreenshot
+
+logger = logging.getLogger(__name__)
+
+# Most efficient first; browsers take the first <source> type they support
+FORMATS = {'avif': ('AVIF', 'image/avif'), 'webp': ('WEBP', 'image/webp')}
+
+
+def variant_widths():
+    return sorted(getattr(settings, 'THUMBNAIL_WIDTHS', [320, 640, 960, 1280]))
+
+
+def variant_formats():
+    """Configured formats this Pillow build can encode, in FORMATS order"""
+    configured = getattr(settings, 'THUMBNAIL_FORMATS', ['webp'])
+    return [fmt for fmt in FORMATS if fmt in configured and features.check(fmt)]
+
+
+def variant_name(directory, source_name, digest, width, fmt):
+    """Content-hashed name: a new upload gets new URLs, the same image reuses its files"""
+    return f'{directory}/{PurePosixPath(source_name).stem}.{digest}.{width}w.{fmt}'
+
+
+def generate_variants(field_file, directory, force=False):
+    """Encode every configured width/format of `field_file` into `directory`
+
+    Variants already in storage under their content-hashed name are reused
+    rather than re-encoded (unless `force`). Images are never upscaled.
+    Returns the value stored in the model's variants field, including the
+    image's average colour as a placeholder to paint before it loads.
+    """
+    storage = field_file.storage
+    with field_file.open('rb') as f:
+        data = f.read()
+    digest = hashlib.sha256(data).hexdigest()[:16]
+    image = ImageOps.exif_transpose(Image.open(BytesIO(data)))
+    if image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA' if 'A' in image.getbands() or 'transparency' in image.info else 'RGB')
+    quality = getattr(settings, 'THUMBNAIL_QUALITY', 80)
+
+    variants = []
+    for width in sorted({min(width, image.width) for width in variant_widths()}):
+        height = max(1, round(image.height * width / image.width))
+        resized = None
+        for fmt in variant_formats():
+            name = variant_name(directory, field_file.name, digest, width, fmt)
+            if force or not storage.exists(name):
+                if resized is None:
+                    resized = image.resize((width, height), Image.Resampling.LANCZOS)
+                buffer = BytesIO()
+                resized.save(buffer, FORMATS[fmt][0], quality=quality)
+                if storage.exists(name):
+                    storage.delete(name)
+                name = storage.save(name, ContentFile(buffer.getvalue()))
+            variants.append({'name': name, 'width': width, 'height': height, 'format': fmt})
+    red, green, blue = image.convert('RGB').resize((1, 1), Image.Resampling.BOX).getpixel((0, 0))
+    return {
+        'source': field_file.name,
+        'variants': variants,
+        'width': image.width,
+        'height': image.height,
+        'placeholder': f'#{red:02x}{green:02x}{blue:02x}',
+    }
+
+
+def current_variants(field_file, data):
+    """`data` if it was generated from the file now in `field_file`, else {}"""
+    data = data or {}
+    if not field_file or data.get('source') != field_file.name:
+        return {}
+    return data
+
+
+def srcsets(field_file, data, build_url=None):
+    """{format: srcset} of the variants of `field_file`, best format first
+
+    Empty while variants for the current upload are still being generated,
+    so callers fall back to the original image.
+    """
+    data = current_variants(field_file, data)
+    if not data:
+        return {}
+    storage = field_file.storage
+    srcsets = {}
+    for variant in data['variants']:
+        url = storage.url(variant['name'])
+        if build_url is not None:
+            url = build_url(url)
+        srcsets.setdefault(variant['format'], []).append(f"{url} {variant['width']}w")
+    return {fmt: ', '.join(srcsets[fmt]) for fmt in FORMATS if fmt in srcsets}
+
+
+def thumbnail_srcsets(project, build_url=None):
+    return srcsets(project.thumbnail, project.thumbnail_variants, build_url)
+
+
+def picture_sources(field_file, data):
+    """<source> attributes for a <picture> element"""
+    return [
+        {'type': FORMATS[fmt][1], 'srcset': srcset}
+        for fmt, srcset in srcsets(field_file, data).items()
+    ]
+
+
+class VariantPipeline:
+    """Generates resized variants of an image field after it changes
+
+    With THUMBNAIL_BACKGROUND on, encoding runs on a worker pool once the
+    saving transaction commits, so uploads don't wait for it; pages show
+    the original image until the variants are stored.
+    """
+
+    model = None
+    field = None
+    variants_field = None
+    directory = None
+    _executor = None
+
+    @property
+    def background(self):
+        return getattr(settings, 'THUMBNAIL_BACKGROUND', True)
+
+    def sync(self, instance):
+        """Called after `instance` is saved: (re)generate or drop its variants"""
+        source_name = getattr(instance, self.field).name or ''
+        if source_name == getattr(instance, self.variants_field).get('source', ''):
+            return
+        if not source_name:
+            self.model.objects.filter(pk=instance.pk).update(**{self.variants_field: {}})
+            return
+        self.schedule(instance.pk, source_name)
+
+    def schedule(self, pk, source_name):
+        if not self.background:
+            self.process(pk, source_name)
+            return
+        if VariantPipeline._executor is None:
+            # One pool shared by every pipeline
+            VariantPipeline._executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, 'THUMBNAIL_WORKERS', 2), thread_name_prefix='thumbnails'
+            )
+        transaction.on_commit(lambda: VariantPipeline._executor.submit(self._in_background, pk, source_name))
+
+    def process(self, pk, source_name, force=False):
+        """Generate and store variants unless the image has changed again meanwhile"""
+        current = self.model.objects.filter(pk=pk, **{self.field: source_name})
+        instance = current.only('pk', self.field).first()
+        if instance is None:
+            return False
+        data = generate_variants(getattr(instance, self.field), self.directory, force=force)
+        updated = current.update(
+            **{self.variants_field: data, 'updated_date': timezone.now()}, **self.extra_updates(data)
+        )
+        if updated:
+            self.stored(pk)
+        return bool(updated)
+
+    def extra_updates(self, data):
+        return {}
+
+    def stored(self, pk):
+        invalidate_content()
+
+    def _in_background(self, pk, source_name):
+        try:
+            self.process(pk, source_name)
+        except Exception:
+            logger.exception('Failed to generate image variants for %s %s', self.model.__name__, pk)
+        finally:
+            # Executor threads outlive the job; don't hold a connection between images
+            connections.close_all()
+
+
+class ThumbnailPipeline(VariantPipeline):
+    model = Project
+    field = 'thumbnail'
+    variants_field = 'thumbnail_variants'
+    directory = 'project_thumbnails/variants'
+
+
+class ScreenshotPipeline(VariantPipeline):
+    model = ProjectScreenshot
+    field = 'image'
+    variants_field = 'variants'
+    directory = 'project_screenshots/variants'
+
+    def extra_updates(self, data):
+        return {'width': data['width'], 'height': data['height']}
+
+    def stored(self, pk):
+        # The project's API payload embeds its screenshots
+        Project.objects.filter(screenshots=pk).update(updated_date=timezone.now())
+        super().stored(pk)
+
+
+thumbnail_pipeline = ThumbnailPipeline()
+screenshot_pipeline = ScreenshotPipeline()
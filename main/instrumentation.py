@@ -0,0 +1,187 @@
+import threading
+import time
+from collections import defaultdict, deque
+from contextvars import ContextVar
+
+from django.template.backends.django import DjangoTemplates
+
+# Metrics for the request being handled on this thread/task, if instrumented
+current_metrics = ContextVar('current_metrics', default=None)
+
+
+class RequestMetrics:
+    """Timings collected while a single request is handled"""
+
+    __slots__ = ('start', 'db_queries', 'db_time', 'template_time')
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.db_queries = 0
+        self.db_time = 0.0
+        self.template_time = 0.0
+
+    def execute_wrapper(self, execute, sql, params, many, context):
+        """connection.execute_wrapper hook counting queries and their time"""
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - start
+            self.db_queries += 1
+
+
+def record_query(execute, sql, params, many, context):
+    """Execute wrapper charging each query to the request in progress, if any"""
+    metrics = current_metrics.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    return metrics.execute_wrapper(execute, sql, params, many, context)
+
+
+def instrument_connection(sender=None, connection=None, **kwargs):
+    """connection_created receiver; async ORM calls use per-thread connections"""
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class EndpointStats:
+    """Recent samples per URL name, summarised into percentiles on demand
+
+    Only the last `window` samples per endpoint are kept, so memory stays
+    bounded and percentiles reflect current behaviour. Counts are per
+    process.
+    """
+
+    METRICS = ('total_ms', 'db_ms', 'db_queries', 'template_ms', 'response_bytes')
+
+    def __init__(self, window=1000):
+        self.window = window
+        self._samples = defaultdict(lambda: deque(maxlen=self.window))
+        self._requests = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def record(self, endpoint, sample):
+        with self._lock:
+            self._samples[endpoint].append(sample)
+            self._requests[endpoint] += 1
+
+    def snapshot(self):
+        with self._lock:
+            samples = {endpoint: list(values) for endpoint, values in self._samples.items()}
+            requests = dict(self._requests)
+        summary = {}
+        for endpoint, values in samples.items():
+            stats = {'requests': requests[endpoint], 'window': len(values)}
+            for metric in self.METRICS:
+                column = sorted(sample[metric] for sample in values)
+                stats[metric] = {
+                    'mean': round(sum(column) / len(column), 3),
+                    'p50': round(percentile(column, 0.50), 3),
+                    'p90': round(percentile(column, 0.90), 3),
+                    'p99': round(percentile(column, 0.99), 3),
+                    'max': round(column[-1], 3),
+                }
+            summary[endpoint] = stats
+        return summary
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._requests.clear()
+
+
+performance_stats = EndpointStats()
+
+
+class ConnectionStats:
+    """Database connections opened versus requests served, per process
+
+    With persistent connections or a pool most requests should reuse a
+    connection, so `opened` stays far below `requests`.
+    """
+
+    def __init__(self):
+        self._opened = defaultdict(int)
+        self._requests = 0
+        self._lock = threading.Lock()
+
+    def connection_opened(self, alias):
+        with self._lock:
+            self._opened[alias] += 1
+
+    def request_finished(self):
+        with self._lock:
+            self._requests += 1
+
+    def snapshot(self):
+        from django.db import connections
+
+        with self._lock:
+            opened, requests = dict(self._opened), self._requests
+        summary = {'requests': requests, 'databases': {}}
+        for alias in connections:
+            settings_dict = connections.settings[alias]
+            count = opened.get(alias, 0)
+            stats = {
+                'connections_opened': count,
+                'reuse_rate': round(max(0.0, 1 - count / requests), 3) if requests else None,
+                'conn_max_age': settings_dict.get('CONN_MAX_AGE', 0),
+                'health_checks': settings_dict.get('CONN_HEALTH_CHECKS', False),
+                'pool': bool(settings_dict.get('OPTIONS', {}).get('pool')),
+            }
+            # Django keeps one psycopg pool per alias once it has been used
+            pool = getattr(type(connections[alias]), '_connection_pools', {}).get(alias)
+            if pool is not None:
+                # Every checkout fires connection_created, so use the pool's own counts
+                pool_stats = stats['pool_stats'] = pool.get_stats()
+                checkouts = pool_stats.get('requests_num', 0)
+                created = stats['connections_opened'] = pool_stats.get('connections_num', 0)
+                stats['checkouts'] = checkouts
+                stats['reuse_rate'] = round(max(0.0, 1 - created / checkouts), 3) if checkouts else None
+            summary['databases'][alias] = stats
+        return summary
+
+    def reset(self):
+        with self._lock:
+            self._opened.clear()
+            self._requests = 0
+
+
+connection_stats = ConnectionStats()
+
+
+class InstrumentedTemplate:
+    """Wraps a backend template to add its render time to the current request"""
+
+    def __init__(self, template):
+        self.template = template
+
+    def __getattr__(self, name):
+        return getattr(self.template, name)
+
+    def render(self, context=None, request=None):
+        metrics = current_metrics.get()
+        if metrics is None:
+            return self.template.render(context, request)
+        start = time.perf_counter()
+        try:
+            return self.template.render(context, request)
+        finally:
+            metrics.template_time += time.perf_counter() - start
+
+
+class InstrumentedDjangoTemplates(DjangoTemplates):
+    """Django template backend that reports render time to PerformanceMiddleware"""
+
+    def from_string(self, template_code):
+        return InstrumentedTemplate(super().from_string(template_code))
+
+    def get_template(self, template_name):
+        return InstrumentedTemplate(super().get_template(template_name))
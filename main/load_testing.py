@@ -0,0 +1,357 @@
+import asyncio
+import json
+import time
+from datetime import timedelta
+from io import BytesIO
+from urllib.parse import urlencode
+from wsgiref.util import setup_testing_defaults
+
+from django.conf import settings
+from django.core import signals
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.db import close_old_connections, connection, connections
+from django.db.backends.signals import connection_created
+from django.urls import reverse
+from django.utils import timezone
+
+from . import api_urls, urls
+from .aggregates import invalidate_category_summary, recount_tags, recount_technologies
+from .cache import invalidate_content
+from .content import render_post
+from .instrumentation import RequestMetrics, percentile
+from .models import BlogPost, Project, Skill, Tag, Technology
+from .search import get_search_backend
+
+FIXTURE = settings.BASE_DIR / 'local_data.json'
+
+# Monitoring endpoints are staff-only and not part of the public surface
+STAFF_ONLY = {'api_cache_stats', 'api_performance', 'api_db_stats'}
+
+# Extra query strings exercised on top of each route's plain URL
+VARIANTS = {
+    'projects': [{'technology': 'Python'}, {'status': 'completed'}],
+    'blog': [{'search': 'django'}, {'category': 'learning'}],
+    'api_project_list': [{'featured': 'true'}],
+    'api_blog_list': [{'category': 'learning'}],
+}
+
+CONTACT_PAYLOAD = {
+    'name': 'Load Test',
+    'email': 'loadtest@example.com',
+    'subject': 'Benchmark',
+    'message': 'Synthetic contact submission',
+}
+
+
+def load_fixture():
+    """Field values from local_data.json, grouped by model label
+
+    The dump starts with a few lines of database info before the JSON array,
+    so everything up to the first '[' is skipped.
+    """
+    text = FIXTURE.read_text()
+    records = json.loads(text[text.index('\n[') + 1:])
+    fixture = {}
+    for record in records:
+        fixture.setdefault(record['model'], []).append(record['fields'])
+    return fixture
+
+
+def choice_values(model, field):
+    return [value for value, label in model._meta.get_field(field).choices]
+
+
+def seed_dataset(scale, batch_size=1000):
+    """Create `scale` projects and blog posts (plus tags, technologies and skills)
+
+    Rows are modelled on the local_data.json fixture. Returns the sample
+    slugs used to fill in detail-route arguments, plus the fixture
+    technologies this call had to create, for clear_dataset().
+    """
+    fixture = load_fixture()
+    project_template = fixture['main.project'][0]
+    post_template = fixture['main.blogpost'][0]
+    skill_template = fixture['main.skill'][0]
+    statuses = choice_values(Project, 'status')
+    post_categories = choice_values(BlogPost, 'category')
+    skill_categories = choice_values(Skill, 'category')
+    tech_categories = choice_values(Technology, 'category')
+    now = timezone.now()
+
+    # Keep the fixture's technologies (filters like ?technology=Python rely on them)
+    technologies, created_technologies = [], []
+    for fields in fixture['main.technology']:
+        technology, created = Technology.objects.get_or_create(name=fields['name'], defaults={
+            'category': fields['category'], 'color': fields['color'],
+        })
+        technologies.append(technology)
+        if created:
+            created_technologies.append(technology.pk)
+    technologies += Technology.objects.bulk_create(
+        Technology(name=f'Loadtest tech {i}', category=tech_categories[i % len(tech_categories)])
+        for i in range(min(45, max(5, scale // 20)))
+    )
+    tags = Tag.objects.bulk_create(
+        Tag(name=f'Loadtest tag {i}', slug=f'loadtest-tag-{i}')
+        for i in range(min(200, max(5, scale // 10)))
+    )
+    Skill.objects.bulk_create(
+        Skill(
+            name=f'Loadtest skill {i}',
+            category=skill_categories[i % len(skill_categories)],
+            proficiency=skill_template['proficiency'],
+            years_experience=skill_template['years_experience'],
+            description=skill_template['description'],
+        )
+        for i in range(min(100, max(5, scale // 10)))
+    )
+
+    projects = Project.objects.bulk_create((
+        Project(
+            title=f"{project_template['title']} {i}",
+            slug=f'loadtest-project-{i}',
+            description=project_template['description'],
+            detailed_description=project_template['detailed_description'],
+            github_url=project_template['github_url'],
+            status=statuses[i % len(statuses)],
+            priority=i % 10,
+            featured=i % 10 == 0,
+        )
+        for i in range(scale)
+    ), batch_size=batch_size)
+    rendered = render_post(post_template['content'], post_template['excerpt'])
+    posts = BlogPost.objects.bulk_create((
+        BlogPost(
+            title=f"{post_template['title']} {i}",
+            slug=f'loadtest-post-{i}',
+            content=post_template['content'],
+            excerpt=post_template['excerpt'],
+            **rendered,
+            category=post_categories[i % len(post_categories)],
+            related_project=projects[i % len(projects)],
+            published=i % 10 != 9,
+            published_date=now - timedelta(minutes=i),
+        )
+        for i in range(scale)
+    ), batch_size=batch_size)
+
+    Project.technologies.through.objects.bulk_create((
+        Project.technologies.through(project_id=project.pk, technology_id=technologies[(i + k) % len(technologies)].pk)
+        for i, project in enumerate(projects) for k in range(3)
+    ), batch_size=batch_size)
+    BlogPost.tags.through.objects.bulk_create((
+        BlogPost.tags.through(blogpost_id=post.pk, tag_id=tags[(i + k) % len(tags)].pk)
+        for i, post in enumerate(posts) for k in range(2)
+    ), batch_size=batch_size)
+    BlogPost.related_technologies.through.objects.bulk_create((
+        BlogPost.related_technologies.through(
+            blogpost_id=post.pk, technology_id=technologies[i % len(technologies)].pk
+        )
+        for i, post in enumerate(posts)
+    ), batch_size=batch_size)
+    # bulk_create skips save() and its signals, so index, count and invalidate in one pass
+    get_search_backend().rebuild()
+    recount_technologies()
+    recount_tags()
+    invalidate_category_summary()
+    invalidate_content()
+    return {'project': projects[0].slug, 'post': posts[0].slug, 'created_technologies': created_technologies}
+
+
+def clear_dataset(sample):
+    """Delete the rows seed_dataset created, keeping fixture technologies that already existed"""
+    BlogPost.objects.filter(slug__startswith='loadtest-').delete()
+    Project.objects.filter(slug__startswith='loadtest-').delete()
+    Tag.objects.filter(slug__startswith='loadtest-').delete()
+    Technology.objects.filter(name__startswith='Loadtest ').delete()
+    Technology.objects.filter(pk__in=sample['created_technologies']).delete()
+    Skill.objects.filter(name__startswith='Loadtest ').delete()
+    # Like seeding, the bulk deletes skip the signals that keep these current
+    get_search_backend().rebuild()
+    recount_technologies()
+    recount_tags()
+    invalidate_category_summary()
+    invalidate_content()
+
+
+def route_arguments(name, sample):
+    """URL kwargs for a route; unknown routes fail loudly so none go unbenchmarked"""
+    arguments = {
+        'projects_page': {'page': 2},
+        'blog_page': {'page': 2},
+        'project_detail': {'slug': sample['project']},
+        'api_project_detail': {'slug': sample['project']},
+        'blog_detail': {'slug': sample['post']},
+        'api_blog_detail': {'slug': sample['post']},
+    }
+    if name in arguments:
+        return arguments[name]
+    raise ValueError(f"No sample arguments for route '{name}'; add them to route_arguments()")
+
+
+def public_routes(sample):
+    """(label, method, path, query, body) for every route in main.urls and main.api_urls"""
+    routes = []
+    for pattern in urls.urlpatterns + api_urls.urlpatterns:
+        name = pattern.name
+        if name in STAFF_ONLY:
+            continue
+        kwargs = route_arguments(name, sample) if pattern.pattern.converters else {}
+        path = reverse(name, kwargs=kwargs)
+        if name == 'api_contact_create':
+            routes.append((name, 'POST', path, '', json.dumps(CONTACT_PAYLOAD).encode()))
+            continue
+        routes.append((name, 'GET', path, '', b''))
+        for params in VARIANTS.get(name, []):
+            query = urlencode(params)
+            routes.append((f'{name}?{query}', 'GET', path, query, b''))
+    return routes
+
+
+class WSGIDriver:
+    """Calls the project's WSGI handler in-process, without a network socket"""
+
+    def __init__(self, host='localhost'):
+        self.handler = WSGIHandler()
+        self.host = host
+        self.last_headers = {}
+
+    def request(self, method, path, query='', body=b'', headers=None):
+        """Returns (status code, body size); the response headers go in `last_headers`"""
+        environ = {}
+        setup_testing_defaults(environ)
+        environ.update({
+            'REQUEST_METHOD': method,
+            'PATH_INFO': path,
+            'QUERY_STRING': query,
+            'HTTP_HOST': self.host,
+            'CONTENT_LENGTH': str(len(body)),
+            'wsgi.input': BytesIO(body),
+        })
+        for name, value in (headers or {}).items():
+            environ[f"HTTP_{name.upper().replace('-', '_')}"] = value
+        if body:
+            environ['CONTENT_TYPE'] = 'application/json'
+        status = []
+
+        def start_response(response_status, response_headers, exc_info=None):
+            status.append(response_status)
+            self.last_headers = dict(response_headers)
+
+        result = self.handler(environ, start_response)
+        try:
+            size = sum(len(chunk) for chunk in result)
+        finally:
+            result.close()
+        return int(status[0].split()[0]), size
+
+    def __enter__(self):
+        # Like the test client: keep the connection (and its open transaction) across requests
+        signals.request_started.disconnect(close_old_connections)
+        signals.request_finished.disconnect(close_old_connections)
+        return self
+
+    def __exit__(self, *exc_info):
+        signals.request_started.connect(close_old_connections)
+        signals.request_finished.connect(close_old_connections)
+
+
+class ASGIDriver:
+    """Calls the project's ASGI handler in-process, without a network socket"""
+
+    def __init__(self, host='localhost'):
+        self.handler = ASGIHandler()
+        self.host = host
+
+    async def request(self, method, path, query='', body=b''):
+        headers = [(b'host', self.host.encode()), (b'content-length', str(len(body)).encode())]
+        if body:
+            headers.append((b'content-type', b'application/json'))
+        scope = {
+            'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1',
+            'method': method, 'scheme': 'http', 'path': path, 'raw_path': path.encode(),
+            'query_string': query.encode(), 'root_path': '', 'headers': headers,
+            'client': ('127.0.0.1', 0), 'server': (self.host, 80),
+        }
+        messages = [{'type': 'http.request', 'body': body, 'more_body': False}]
+        response = {'status': None, 'size': 0}
+
+        async def receive():
+            if messages:
+                return messages.pop()
+            # Django listens for a disconnect until the response is sent; never send one
+            await asyncio.Event().wait()
+
+        async def send(message):
+            if message['type'] == 'http.response.start':
+                response['status'] = message['status']
+            elif message['type'] == 'http.response.body':
+                response['size'] += len(message.get('body', b''))
+
+        await self.handler(scope, receive, send)
+        return response['status'], response['size']
+
+
+class SimulatedLatency:
+    """Adds a fixed delay to every query on every connection, like a distant database"""
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+    def __call__(self, execute, sql, params, many, context):
+        time.sleep(self.seconds)
+        return execute(sql, params, many, context)
+
+    def install(self, sender=None, connection=None, **kwargs):
+        if self not in connection.execute_wrappers:
+            connection.execute_wrappers.append(self)
+
+    def __enter__(self):
+        # Worker threads open their own connections, so hook each new one too
+        connection_created.connect(self.install)
+        for existing in connections.all(initialized_only=True):
+            self.install(connection=existing)
+        return self
+
+    def __exit__(self, *exc_info):
+        connection_created.disconnect(self.install)
+        for existing in connections.all(initialized_only=True):
+            if self in existing.execute_wrappers:
+                existing.execute_wrappers.remove(self)
+
+
+def benchmark_route(driver, route, requests, warmup=1):
+    """Drive one route sequentially and summarise latency and query counts
+
+    `errors` counts timed responses with a 4xx/5xx status, whose timings
+    measure the error path rather than the route.
+    """
+    label, method, path, query, body = route
+    for _ in range(warmup):
+        driver.request(method, path, query, body)
+    timings, queries, errors = [], [], 0
+    started = time.perf_counter()
+    for _ in range(requests):
+        metrics = RequestMetrics()
+        with connection.execute_wrapper(metrics.execute_wrapper):
+            status, size = driver.request(method, path, query, body)
+        timings.append((time.perf_counter() - metrics.start) * 1000)
+        queries.append(metrics.db_queries)
+        errors += status >= 400
+    elapsed = time.perf_counter() - started
+    timings.sort()
+    return {
+        'route': label,
+        'method': method,
+        'path': path + (f'?{query}' if query else ''),
+        'status': status,
+        'errors': errors,
+        'bytes': size,
+        'requests': requests,
+        'rps': round(requests / elapsed, 1),
+        'mean_ms': round(sum(timings) / len(timings), 3),
+        'p50_ms': round(percentile(timings, 0.50), 3),
+        'p99_ms': round(percentile(timings, 0.99), 3),
+        'queries': max(queries),
+    }
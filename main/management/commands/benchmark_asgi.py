@@ -0,0 +1,115 @@
+import asyncio
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+from django.urls import include, path
+
+from main.api_urls import read_urlpatterns
+from main.instrumentation import percentile
+from main.load_testing import ASGIDriver, SimulatedLatency, WSGIDriver, clear_dataset, seed_dataset
+
+
+def api_urlconf(async_views):
+    """URLconf holding only the read-only API, as sync DRF views or async twins"""
+    module = types.ModuleType(f"benchmark_api_urls_{'async' if async_views else 'sync'}")
+    module.urlpatterns = [path('api/', include(read_urlpatterns(async_views)))]
+    return module
+
+
+class Command(BaseCommand):
+    help = 'Compare concurrent read-API throughput under WSGI and ASGI with a slow database'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--posts', type=int, default=200, help='Projects/posts to seed')
+        parser.add_argument('--requests', type=int, default=200, help='Requests per run')
+        parser.add_argument('--concurrency', type=int, default=20, help='Concurrent clients')
+        parser.add_argument(
+            '--db-latency', type=float, default=20,
+            help='Milliseconds added to every query to simulate a remote database'
+        )
+        parser.add_argument(
+            '--wsgi-workers', type=int, default=1,
+            help='Requests a WSGI deployment handles at once (gunicorn sync workers x threads)'
+        )
+
+    def handle(self, *args, **options):
+        # Worker threads use their own connections, so the dataset has to be committed;
+        # clear_dataset() removes exactly what was added
+        sample = seed_dataset(options['posts'])
+        try:
+            paths = self.paths(sample)
+            requests = [paths[i % len(paths)] for i in range(options['requests'])]
+            runs = [
+                ('wsgi, sync views', False, self.run_wsgi),
+                ('asgi, sync views', False, self.run_asgi),
+                ('asgi, async views', True, self.run_asgi),
+            ]
+            self.stdout.write(
+                f"{options['requests']} requests, {options['concurrency']} concurrent clients, "
+                f"{options['wsgi_workers']} WSGI worker(s), {options['db_latency']:g} ms per query"
+            )
+            self.stdout.write(f"{'mode':<22}{'req/s':>9}{'p50 ms':>10}{'p99 ms':>10}{'errors':>8}")
+            with SimulatedLatency(options['db_latency'] / 1000):
+                for label, async_views, run in runs:
+                    with override_settings(ROOT_URLCONF=api_urlconf(async_views)):
+                        elapsed, timings, errors = run(requests, options)
+                    timings.sort()
+                    self.stdout.write(
+                        f'{label:<22}{len(requests) / elapsed:>9.1f}'
+                        f'{percentile(timings, 0.50):>10.1f}{percentile(timings, 0.99):>10.1f}{errors:>8}'
+                    )
+        finally:
+            clear_dataset(sample)
+
+    @staticmethod
+    def paths(sample):
+        return [
+            '/api/projects/',
+            f"/api/projects/{sample['project']}/",
+            '/api/technologies/',
+            '/api/blog/',
+            f"/api/blog/{sample['post']}/",
+            '/api/skills/',
+        ]
+
+    def run_wsgi(self, requests, options):
+        driver = WSGIDriver()
+
+        def call(path):
+            start = time.perf_counter()
+            status, size = driver.request('GET', path)
+            return (time.perf_counter() - start) * 1000, status
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options['wsgi_workers']) as pool:
+            results = list(pool.map(call, requests))
+        return self.summarise(started, results)
+
+    def run_asgi(self, requests, options):
+        driver = ASGIDriver()
+        pending = list(reversed(requests))
+        results = []
+
+        async def client():
+            while pending:
+                path = pending.pop()
+                start = time.perf_counter()
+                status, size = await driver.request('GET', path)
+                results.append(((time.perf_counter() - start) * 1000, status))
+
+        async def run():
+            await asyncio.gather(*(client() for _ in range(options['concurrency'])))
+
+        started = time.perf_counter()
+        asyncio.run(run())
+        return self.summarise(started, results)
+
+    @staticmethod
+    def summarise(started, results):
+        elapsed = time.perf_counter() - started
+        timings = [timing for timing, status in results]
+        errors = sum(1 for timing, status in results if status != 200)
+        return elapsed, timings, errors
@@ -0,0 +1,82 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from main.models import Project
+from main.pagination import KeysetPagination
+
+
+class Command(BaseCommand):
+    help = 'Compare deep-page latency of keyset pagination against LIMIT/OFFSET'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes', type=int, nargs='+', default=[1000, 10000, 50000],
+            help='Project table sizes to test'
+        )
+        parser.add_argument('--page-size', type=int, default=20)
+        parser.add_argument('--repeat', type=int, default=20, help='Runs per measurement')
+
+    def handle(self, *args, **options):
+        page_size = options['page_size']
+        self.stdout.write(f"{'rows':>8}{'depth':>8}{'offset ms':>12}{'keyset ms':>12}")
+        # Everything runs in a transaction that is rolled back, leaving the database untouched
+        with transaction.atomic():
+            seeded = 0
+            for size in sorted(options['sizes']):
+                self.seed(seeded, size)
+                seeded = size
+                for depth in (0.5, 0.99):
+                    offset = int(size * depth)
+                    offset_ms = self.time(options['repeat'], lambda: self.offset_page(offset, page_size))
+                    cursor_url = self.cursor_at(offset, page_size)
+                    keyset_ms = self.time(options['repeat'], lambda: self.keyset_page(cursor_url))
+                    self.stdout.write(f'{size:>8}{offset:>8}{offset_ms:>12.2f}{keyset_ms:>12.2f}')
+            transaction.set_rollback(True)
+
+    def seed(self, start, stop):
+        Project.objects.bulk_create(
+            Project(
+                title=f'Benchmark project {i}',
+                slug=f'benchmark-{i}',
+                description='Synthetic project for pagination benchmarks',
+                priority=i % 10,
+            )
+            for i in range(start, stop)
+        )
+
+    def queryset(self):
+        return Project.objects.for_listing()
+
+    def offset_page(self, offset, page_size):
+        queryset = self.queryset()
+        queryset.count()
+        return list(queryset[offset:offset + page_size])
+
+    def cursor_at(self, offset, page_size):
+        """The `next` link a client holds after reading up to `offset`"""
+        row = self.queryset().order_by('-priority', '-created_date', 'pk')[offset - 1]
+        paginator = KeysetPagination()
+        paginator.request = self.request(f'/api/projects/?page_size={page_size}')
+        paginator.ordering = paginator.get_ordering(None, self.queryset())
+        return paginator.encode_cursor(paginator.position_of(row), reverse=False)
+
+    def keyset_page(self, url):
+        paginator = KeysetPagination()
+        return paginator.paginate_queryset(self.queryset(), self.request(url), view=None)
+
+    @staticmethod
+    def request(url):
+        return Request(APIRequestFactory().get(url))
+
+    @staticmethod
+    def time(repeat, func):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - start) * 1000)
+        return sorted(timings)[len(timings) // 2]
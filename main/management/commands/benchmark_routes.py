@@ -0,0 +1,116 @@
+import json
+import subprocess
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import override_settings
+from django.utils import timezone
+
+from main.cache import invalidate_content
+from main.contact_queue import contact_queue
+from main.counters import blog_view_counter
+from main.load_testing import WSGIDriver, benchmark_route, public_routes, seed_dataset
+
+
+class Command(BaseCommand):
+    help = 'Seed synthetic data and benchmark every public route through the WSGI app'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--scales', type=int, nargs='+', default=[10, 1000],
+            help='Projects/posts to seed per run (e.g. 10 1000 100000)'
+        )
+        parser.add_argument('--requests', type=int, default=50, help='Timed requests per route')
+        parser.add_argument('--route', action='append', help='Only benchmark routes with this label (repeatable)')
+        parser.add_argument('--no-cache', action='store_true', help='Measure with the page/fragment cache disabled')
+        parser.add_argument('--output', help='Write results as JSON to this file')
+        parser.add_argument('--compare', help='Earlier --output file to compare p50/p99 against')
+
+    def handle(self, *args, **options):
+        baseline = self.load(options['compare']) if options['compare'] else None
+        caches = settings.CACHES
+        if options['no_cache']:
+            caches = {'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}}
+
+        results = {
+            'commit': self.commit(),
+            'timestamp': timezone.now().isoformat(),
+            'database': connection.vendor,
+            'cache': not options['no_cache'],
+            'scales': {},
+        }
+        # Contact submissions are flushed inline so they roll back with the rest, and
+        # every request comes from one address, so lift the throttle's burst limit
+        # (the bucket is still checked) to time the handler rather than 429s
+        contact_settings = {
+            'CONTACT_QUEUE_BACKGROUND': False, 'CONTACT_NOTIFY_EMAIL': '', 'CONTACT_THROTTLE_BURST': 10 ** 9,
+        }
+        with override_settings(CACHES=caches, **contact_settings), WSGIDriver() as driver, \
+                blog_view_counter.suspended():
+            for scale in options['scales']:
+                # Each scale runs in its own transaction that is rolled back
+                with transaction.atomic():
+                    sample = seed_dataset(scale)
+                    routes = public_routes(sample)
+                    if options['route']:
+                        routes = [route for route in routes if route[0] in options['route']]
+                    rows = [benchmark_route(driver, route, options['requests']) for route in routes]
+                    contact_queue.flush()
+                    transaction.set_rollback(True)
+                # Don't leave pages rendered from rolled-back rows in the cache
+                invalidate_content()
+                results['scales'][str(scale)] = rows
+                self.report(scale, rows, baseline)
+
+        if options['output']:
+            Path(options['output']).write_text(json.dumps(results, indent=2))
+            self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}"))
+        failed = sorted({
+            row['route'] for rows in results['scales'].values() for row in rows if row['errors']
+        })
+        if failed:
+            raise CommandError(f"Error responses were timed for: {', '.join(failed)}")
+
+    def report(self, scale, rows, baseline):
+        previous = {}
+        if baseline:
+            previous = {row['route']: row for row in baseline['scales'].get(str(scale), [])}
+        self.stdout.write(f'\n{scale} projects/posts')
+        self.stdout.write(
+            f"{'route':<40}{'status':>7}{'errors':>8}{'req/s':>9}{'p50 ms':>9}{'p99 ms':>9}{'queries':>9}"
+            + (f"{'p50 Δ':>9}{'p99 Δ':>9}" if baseline else '')
+        )
+        for row in rows:
+            line = (
+                f"{row['route']:<40}{row['status']:>7}{row['errors']:>8}{row['rps']:>9.1f}"
+                f"{row['p50_ms']:>9.2f}{row['p99_ms']:>9.2f}{row['queries']:>9}"
+            )
+            if row['route'] in previous:
+                before = previous[row['route']]
+                line += f"{self.change(before['p50_ms'], row['p50_ms']):>9}{self.change(before['p99_ms'], row['p99_ms']):>9}"
+            self.stdout.write(line)
+
+    @staticmethod
+    def change(before, after):
+        if not before:
+            return '-'
+        return f'{(after - before) / before:+.0%}'
+
+    @staticmethod
+    def load(path):
+        try:
+            return json.loads(Path(path).read_text())
+        except (OSError, ValueError) as exc:
+            raise CommandError(f'Cannot read comparison file {path}: {exc}')
+
+    @staticmethod
+    def commit():
+        try:
+            return subprocess.run(
+                ['git', 'rev-parse', '--short', 'HEAD'], cwd=settings.BASE_DIR,
+                capture_output=True, text=True, check=True
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
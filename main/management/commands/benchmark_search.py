@@ -0,0 +1,66 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from main.models import BlogPost
+from main.search import SimpleSearchBackend, get_search_backend
+
+WORDS = (
+    'django python postgres query index cache template view model serializer '
+    'frontend backend deploy railway docker learning tutorial project review '
+    'database migration testing async python react javascript css html'
+).split()
+
+
+class Command(BaseCommand):
+    help = 'Compare blog search latency of the full-text backend against icontains'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--posts', type=int, default=10000, help='Synthetic posts to create')
+        parser.add_argument('--words', type=int, default=400, help='Words per post body')
+        parser.add_argument('--repeat', type=int, default=20, help='Runs per query')
+        parser.add_argument('--query', action='append', help='Query to time (repeatable)')
+
+    def handle(self, *args, **options):
+        queries = options['query'] or ['django', 'postgres migration', 'nonexistentterm']
+        # Everything runs in a transaction that is rolled back, leaving the database untouched
+        with transaction.atomic():
+            self.seed(options['posts'], options['words'])
+            backends = [('icontains', SimpleSearchBackend()), ('full-text', get_search_backend())]
+            self.stdout.write(f"{'query':<24}{'backend':<12}{'matches':>9}{'mean ms':>10}{'best ms':>10}")
+            for query in queries:
+                for name, backend in backends:
+                    matches, timings = self.time_query(backend, query, options['repeat'])
+                    self.stdout.write(
+                        f'{query:<24}{name:<12}{matches:>9}'
+                        f'{sum(timings) / len(timings):>10.2f}{min(timings):>10.2f}'
+                    )
+            transaction.set_rollback(True)
+
+    def seed(self, count, words):
+        rng = random.Random(0)
+        BlogPost.objects.bulk_create(
+            BlogPost(
+                title=' '.join(rng.choices(WORDS, k=5)).title(),
+                slug=f'benchmark-{i}',
+                content=' '.join(rng.choices(WORDS, k=words)) + f' filler{i}',
+                excerpt=' '.join(rng.choices(WORDS, k=20)),
+                published=True,
+            )
+            for i in range(count)
+        )
+        # bulk_create skips save(), so index in one pass
+        get_search_backend().rebuild()
+
+    def time_query(self, backend, query, repeat):
+        """Time the work the blog view does: count plus the first page"""
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            queryset = backend.search(BlogPost.objects.published(), query)
+            matches = queryset.count()
+            list(queryset[:5])
+            timings.append((time.perf_counter() - start) * 1000)
+        return matches, timings
@@ -0,0 +1,56 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from main.load_testing import seed_dataset
+from main.models import BlogPost, Project, Skill, Technology
+from main.renderers import FastJSONRenderer
+from main.row_serializers import (
+    BlogPostListRowSerializer, ProjectListRowSerializer, SkillRowSerializer, TechnologyRowSerializer
+)
+
+
+class Command(BaseCommand):
+    help = 'Compare rows/sec of the list ModelSerializers and their values()-based twins, rendered to JSON'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1000, help='Projects/posts to seed (and serialize per run)')
+        parser.add_argument('--repeat', type=int, default=5, help='Runs per serializer; the best is reported')
+
+    def handle(self, *args, **options):
+        cases = [
+            (ProjectListRowSerializer, Project.objects.for_listing()),
+            (BlogPostListRowSerializer, BlogPost.objects.published().with_tags().without_bodies()),
+            (TechnologyRowSerializer, Technology.objects.all()),
+            (SkillRowSerializer, Skill.objects.all()),
+        ]
+        self.stdout.write(f"{'serializer':<26}{'rows':>7}{'model rows/s':>14}{'row rows/s':>12}{'speedup':>9}  same bytes")
+        # Rolled back afterwards, so the seeded rows never outlive the benchmark
+        with transaction.atomic():
+            seed_dataset(options['rows'])
+            for row_serializer_class, queryset in cases:
+                stock_rate, stock = self.best(options['repeat'], lambda: JSONRenderer().render(
+                    row_serializer_class.serializer_class(queryset.all(), many=True).data
+                ))
+                fast_rate, fast = self.best(options['repeat'], lambda: FastJSONRenderer().render(
+                    row_serializer_class().serialize(row_serializer_class().rows(queryset.all()))
+                ))
+                rows = queryset.count()
+                self.stdout.write(
+                    f'{row_serializer_class.serializer_class.__name__:<26}{rows:>7}'
+                    f'{rows * stock_rate:>14.0f}{rows * fast_rate:>12.0f}{fast_rate / stock_rate:>8.1f}x'
+                    f"  {'yes' if fast == stock else 'NO'}"
+                )
+            transaction.set_rollback(True)
+
+    @staticmethod
+    def best(repeat, run):
+        """(runs/sec of the fastest of `repeat` runs, the output of the last)"""
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            output = run()
+            timings.append(time.perf_counter() - start)
+        return 1 / min(timings), output
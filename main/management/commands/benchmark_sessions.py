@@ -0,0 +1,95 @@
+import random
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from main.cache import invalidate_content
+from main.counters import blog_view_counter
+from main.load_testing import seed_dataset
+
+PREVIOUS_MIDDLEWARE = 'django.contrib.sessions.middleware.SessionMiddleware'
+SELECTIVE_MIDDLEWARE = 'main.middleware.SelectiveSessionMiddleware'
+
+
+class Command(BaseCommand):
+    help = 'Count session reads/writes under mixed public, API and admin traffic, before and after sessionless views'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=1000, help='Requests per mode')
+        parser.add_argument(
+            '--admin-share', type=float, default=0.1,
+            help='Fraction of requests that are admin pages (the rest are public pages and API reads)'
+        )
+        parser.add_argument(
+            '--logged-in-share', type=float, default=0.3,
+            help='Fraction of public/API requests that carry a logged-in session cookie'
+        )
+
+    def handle(self, *args, **options):
+        previous_middleware = [
+            PREVIOUS_MIDDLEWARE if name == SELECTIVE_MIDDLEWARE else name for name in settings.MIDDLEWARE
+        ]
+        modes = [
+            ('db, save every request', {
+                'MIDDLEWARE': previous_middleware,
+                'SESSION_ENGINE': 'django.contrib.sessions.backends.db',
+                'SESSION_SAVE_EVERY_REQUEST': True,
+            }),
+            ('sessionless public, ' + settings.SESSION_ENGINE.rsplit('.', 1)[-1], {}),
+        ]
+        self.stdout.write(
+            f"{options['requests']} requests: {options['admin_share']:.0%} admin, "
+            f"{options['logged_in_share']:.0%} of public/API traffic logged in"
+        )
+        self.stdout.write(f"{'mode':<32}{'reads':>7}{'writes':>8}{'queries':>9}{'req/s':>8}")
+        with blog_view_counter.suspended():
+            for label, overrides in modes:
+                # Rolled back, so every mode starts from the same data
+                with transaction.atomic():
+                    with override_settings(**overrides):
+                        row = self.run(options)
+                    transaction.set_rollback(True)
+                invalidate_content()
+                self.stdout.write(
+                    f"{label:<32}{row['reads']:>7}{row['writes']:>8}{row['queries']:>9}{row['rate']:>8.0f}"
+                )
+
+    def run(self, options):
+        sample = seed_dataset(20)
+        invalidate_content()
+        public = [
+            reverse('home'), reverse('projects'), reverse('blog'),
+            reverse('project_detail', kwargs={'slug': sample['project']}),
+            reverse('blog_detail', kwargs={'slug': sample['post']}),
+            reverse('api_project_list'), reverse('api_blog_list'),
+        ]
+        admin = [reverse('admin:index'), reverse('admin:main_project_changelist')]
+
+        staff = User.objects.create_superuser('benchmark-sessions', password=None)
+        logged_in, anonymous = Client(), Client()
+        logged_in.force_login(staff)
+        counts = Counter()
+
+        def count_session_queries(execute, sql, params, many, context):
+            counts['queries'] += 1
+            if 'django_session' in sql:
+                counts['reads' if sql.lstrip().upper().startswith('SELECT') else 'writes'] += 1
+            return execute(sql, params, many, context)
+
+        chooser = random.Random(0)
+        started = time.perf_counter()
+        with connection.execute_wrapper(count_session_queries):
+            for _ in range(options['requests']):
+                if chooser.random() < options['admin_share']:
+                    logged_in.get(chooser.choice(admin))
+                    continue
+                client = logged_in if chooser.random() < options['logged_in_share'] else anonymous
+                client.get(chooser.choice(public))
+        counts['rate'] = options['requests'] / (time.perf_counter() - started)
+        return counts
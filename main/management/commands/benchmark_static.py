@@ -0,0 +1,82 @@
+import shutil
+import tempfile
+import time
+
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from main.checks import MANIFEST_STORAGE
+from main.load_testing import WSGIDriver
+
+ASSETS = [
+    'admin/css/base.css',
+    'admin/css/forms.css',
+    'admin/css/responsive.css',
+    'admin/js/core.js',
+    'admin/js/vendor/jquery/jquery.js',
+    'admin/js/vendor/select2/select2.full.js',
+    'admin/img/icon-yes.svg',
+]
+
+MODES = [
+    # (label, STATICFILES storage backend, finders + autorefresh)
+    ('plain, finders', 'django.contrib.staticfiles.storage.StaticFilesStorage', True),
+    ('hashed + compressed', MANIFEST_STORAGE, False),
+]
+
+
+class Command(BaseCommand):
+    help = 'Compare static file throughput and transfer size for the development and production static modes'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=2000, help='Requests per mode')
+        parser.add_argument(
+            '--accept-encoding', default='br, gzip',
+            help='Accept-Encoding sent by the simulated browser (empty for none)'
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(
+            f"{options['requests']} requests over {len(ASSETS)} admin assets, "
+            f"Accept-Encoding: {options['accept_encoding'] or '(none)'}"
+        )
+        self.stdout.write(f"{'mode':<22}{'req/s':>9}{'KB/req':>9}  {'encoding':<10}cache-control")
+        for label, backend, finders in MODES:
+            static_root = tempfile.mkdtemp(prefix='benchmark-static-')
+            try:
+                # DEBUG off as in production: the manifest only hands out hashed URLs then
+                with override_settings(
+                    DEBUG=False,
+                    STATIC_ROOT=static_root,
+                    STORAGES={
+                        'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+                        'staticfiles': {'BACKEND': backend},
+                    },
+                    WHITENOISE_USE_FINDERS=finders,
+                    WHITENOISE_AUTOREFRESH=finders,
+                ):
+                    call_command('collectstatic', interactive=False, verbosity=0)
+                    self.run(label, options)
+            finally:
+                shutil.rmtree(static_root, ignore_errors=True)
+
+    def run(self, label, options):
+        # What {% static %} renders in this mode: hashed names with the manifest
+        paths = [staticfiles_storage.url(name) for name in ASSETS]
+        headers = {'Accept-Encoding': options['accept_encoding']} if options['accept_encoding'] else {}
+        driver = WSGIDriver()
+        transferred = 0
+        started = time.perf_counter()
+        for i in range(options['requests']):
+            status, size = driver.request('GET', paths[i % len(paths)], headers=headers)
+            if status != 200:
+                raise RuntimeError(f'{paths[i % len(paths)]} returned {status}')
+            transferred += size
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            f"{label:<22}{options['requests'] / elapsed:>9.0f}{transferred / options['requests'] / 1024:>9.1f}  "
+            f"{driver.last_headers.get('Content-Encoding', 'identity'):<10}"
+            f"{driver.last_headers.get('Cache-Control', '-')}"
+        )
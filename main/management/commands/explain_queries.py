@@ -0,0 +1,42 @@
+from urllib.parse import urlencode
+
+from django.core.management.base import BaseCommand, CommandError
+
+from main.query_plans import explain_endpoints
+
+
+class Command(BaseCommand):
+    help = 'EXPLAIN the listing queries of each hot endpoint and report index usage'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--verbose-plans', action='store_true', help='Print the full plan for each query')
+        parser.add_argument(
+            '--strict', action='store_true',
+            help='Fail if any ordered listing query does not use an index'
+        )
+
+    def handle(self, *args, **options):
+        results = explain_endpoints()
+        missing = []
+        self.stdout.write(f"{'endpoint':<40}{'table':<16}{'index':<28}{'sort step'}")
+        for result in results:
+            endpoint = result['endpoint']
+            if result['params']:
+                endpoint += '?' + urlencode(result['params'])
+            index = result['index'] or '-- none --'
+            self.stdout.write(
+                f"{endpoint:<40}{result['table']:<16}{index:<28}{'yes' if result['sorts'] else 'no'}"
+            )
+            if options['verbose_plans']:
+                for line in result['plan']:
+                    self.stdout.write(f'    {line}')
+            if result['ordered'] and not result['index']:
+                missing.append(endpoint)
+
+        if missing:
+            message = 'Ordered listing queries without an index: ' + ', '.join(missing)
+            if options['strict']:
+                raise CommandError(message)
+            self.stdout.write(self.style.WARNING(message))
+        else:
+            self.stdout.write(self.style.SUCCESS('Every ordered listing query uses an index'))
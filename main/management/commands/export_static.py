@@ -0,0 +1,54 @@
+import shutil
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from main.static_export import ExportError, StaticExporter
+
+
+class Command(BaseCommand):
+    help = (
+        'Pre-render every page and API snapshot to a static directory. '
+        'HTML routes are written as <path>/index.html, API responses as api/<path>/index.json.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'output_dir', nargs='?', default=settings.STATIC_EXPORT_ROOT,
+            help='Directory to write to (default: STATIC_EXPORT_ROOT)'
+        )
+        parser.add_argument(
+            '--incremental', action='store_true',
+            help='Only re-render pages affected by edits since the last export'
+        )
+        parser.add_argument('--host', default='localhost', help='Host used for absolute URLs')
+        parser.add_argument('--https', action='store_true', help='Render absolute URLs as https')
+        parser.add_argument(
+            '--copy-assets', action='store_true',
+            help='Also copy STATIC_ROOT (run collectstatic first) and MEDIA_ROOT into the export'
+        )
+
+    def handle(self, *args, **options):
+        exporter = StaticExporter(options['output_dir'], host=options['host'], secure=options['https'])
+        try:
+            if options['incremental']:
+                written, removed = exporter.export_changed()
+            else:
+                written, removed = exporter.export_all()
+        except ExportError as e:
+            raise CommandError(str(e))
+
+        if options['copy_assets']:
+            output_dir = Path(options['output_dir'])
+            for source, prefix in ((settings.STATIC_ROOT, settings.STATIC_URL), (settings.MEDIA_ROOT, settings.MEDIA_URL)):
+                if Path(source).exists():
+                    shutil.copytree(source, output_dir / prefix.strip('/'), dirs_exist_ok=True)
+
+        for url in written:
+            self.stdout.write(f'  wrote {url}')
+        for url in removed:
+            self.stdout.write(f'  removed {url}')
+        self.stdout.write(self.style.SUCCESS(
+            f"Exported to {options['output_dir']}: {len(written)} written, {len(removed)} removed"
+        ))
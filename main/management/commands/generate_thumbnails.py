@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from main.images import screenshot_pipeline, thumbnail_pipeline
+
+
+class Command(BaseCommand):
+    help = 'Generate resized variants for every uploaded project thumbnail and screenshot'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force', action='store_true',
+            help='Re-encode variants that already exist (e.g. after changing THUMBNAIL_QUALITY)'
+        )
+
+    def handle(self, *args, **options):
+        for label, pipeline in (('thumbnail', thumbnail_pipeline), ('screenshot', screenshot_pipeline)):
+            generated = 0
+            images = pipeline.model.objects.exclude(**{pipeline.field: ''}).values_list('pk', pipeline.field)
+            for pk, source_name in images:
+                generated += pipeline.process(pk, source_name, force=options['force'])
+            self.stdout.write(self.style.SUCCESS(f'Generated variants for {generated} {label}(s).'))
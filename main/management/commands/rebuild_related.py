@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from main.cache import invalidate_content
+from main.models import RelatedPost, RelatedProject
+from main.related import rebuild_related_index
+
+
+class Command(BaseCommand):
+    help = 'Recompute the related projects/posts index from scratch (run on deploy; migrations leave it empty)'
+
+    def handle(self, *args, **options):
+        rebuild_related_index()
+        # Detail pages cached before the rebuild still show the old lists
+        invalidate_content()
+        self.stdout.write(self.style.SUCCESS(
+            f'Indexed {RelatedProject.objects.count()} related projects '
+            f'and {RelatedPost.objects.count()} related posts.'
+        ))
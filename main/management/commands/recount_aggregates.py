@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from main.aggregates import invalidate_category_summary, recount_tags, recount_technologies
+
+
+class Command(BaseCommand):
+    help = 'Recompute the denormalized technology/tag counts and drop the cached category summary'
+
+    def handle(self, *args, **options):
+        technologies = recount_technologies()
+        tags = recount_tags()
+        invalidate_category_summary()
+        self.stdout.write(self.style.SUCCESS(
+            f'Repaired {technologies} technology and {tags} tag count(s).'
+        ))
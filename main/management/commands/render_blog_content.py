@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from main.cache import invalidate_content
+from main.content import render_all_posts
+
+
+class Command(BaseCommand):
+    help = 'Re-render the stored HTML, summary and reading time of every blog post (run on deploy)'
+
+    def handle(self, *args, **options):
+        changed = render_all_posts()
+        if changed:
+            # bulk_update skips the signals that normally invalidate cached pages
+            invalidate_content()
+        self.stdout.write(self.style.SUCCESS(f'Re-rendered {changed} post(s).'))
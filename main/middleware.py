@@ -0,0 +1,93 @@
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+from .instrumentation import RequestMetrics, current_metrics, instrument_connection, performance_stats
+from .sessions import SessionlessStore
+
+
+class PerformanceMiddleware:
+    """Per-request wall/DB/template timing, aggregated per URL name
+
+    Adds a Server-Timing header to every response and feeds the staff-only
+    /api/performance/ endpoint. With PERFORMANCE_METRICS off the middleware
+    removes itself at startup, so it costs nothing. Works under WSGI and
+    ASGI: queries are attributed through a context variable, which follows
+    async ORM calls into their worker threads.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'PERFORMANCE_METRICS', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        connection_created.connect(instrument_connection, dispatch_uid='performance_metrics')
+        for connection in connections.all(initialized_only=True):
+            instrument_connection(connection=connection)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        metrics = RequestMetrics()
+        token = current_metrics.set(metrics)
+        try:
+            response = self.get_response(request)
+        finally:
+            current_metrics.reset(token)
+        return self.finish(request, response, metrics)
+
+    async def __acall__(self, request):
+        metrics = RequestMetrics()
+        token = current_metrics.set(metrics)
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_metrics.reset(token)
+        return self.finish(request, response, metrics)
+
+    def finish(self, request, response, metrics):
+        total = time.perf_counter() - metrics.start
+        size = 0 if response.streaming else len(response.content)
+        match = getattr(request, 'resolver_match', None)
+        endpoint = match.view_name if match else 'unresolved'
+        performance_stats.record(endpoint, {
+            'total_ms': total * 1000,
+            'db_ms': metrics.db_time * 1000,
+            'db_queries': metrics.db_queries,
+            'template_ms': metrics.template_time * 1000,
+            'response_bytes': size,
+        })
+        response['Server-Timing'] = ', '.join([
+            f'total;dur={total * 1000:.2f}',
+            f'db;dur={metrics.db_time * 1000:.2f};desc="{metrics.db_queries} queries"',
+            f'tpl;dur={metrics.template_time * 1000:.2f}',
+        ])
+        return response
+
+
+class SelectiveSessionMiddleware(SessionMiddleware):
+    """SessionMiddleware that leaves @sessionless views alone
+
+    The session store is lazy, so swapping it out before the view runs
+    means public pages and the read-only API never load the session, never
+    save it (whatever SESSION_SAVE_EVERY_REQUEST says) and don't add
+    Vary: Cookie, even when the visitor sends a session cookie.
+    """
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if getattr(view_func, 'sessionless', False):
+            request.session = SessionlessStore()
+
+    def process_response(self, request, response):
+        if isinstance(getattr(request, 'session', None), SessionlessStore):
+            return response
+        return super().process_response(request, response)
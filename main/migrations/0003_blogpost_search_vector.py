@@ -0,0 +1,52 @@
+# Generated by Django 5.2.2 on 2026-10-18 19:33
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+def create_search_index(apps, schema_editor):
+    """GIN index + backfill on PostgreSQL, FTS5 table + backfill on SQLite"""
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute(
+            'CREATE INDEX main_blogpost_search_vector_gin ON main_blogpost USING gin (search_vector)'
+        )
+        schema_editor.execute(
+            "UPDATE main_blogpost SET search_vector = "
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(excerpt, '')), 'B') || "
+            "setweight(to_tsvector('english', coalesce(content, '')), 'C')"
+        )
+    elif vendor == 'sqlite':
+        schema_editor.execute(
+            "CREATE VIRTUAL TABLE main_blogpost_fts USING fts5("
+            "title, excerpt, content, tokenize='porter unicode61')"
+        )
+        schema_editor.execute(
+            'INSERT INTO main_blogpost_fts (rowid, title, excerpt, content) '
+            'SELECT id, title, excerpt, content FROM main_blogpost'
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS main_blogpost_search_vector_gin')
+    elif vendor == 'sqlite':
+        schema_editor.execute('DROP TABLE IF EXISTS main_blogpost_fts')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0002_contact_skill_tag_blogpost'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpost',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.2 on 2026-10-18 19:57
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# The tables start empty: scoring lives in main/related.py and changes with it,
+# so `manage.py rebuild_related` (run on deploy) fills them rather than this
+# migration running today's code against historical models.
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0005_listing_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RelatedPost',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField()),
+                ('source', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_entries', to='main.blogpost')),
+                ('target', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_from', to='main.blogpost')),
+            ],
+            options={
+                'ordering': ['source', '-score'],
+                'indexes': [models.Index(fields=['source', '-score'], name='relatedpost_rank_idx')],
+                'constraints': [models.UniqueConstraint(fields=('source', 'target'), name='relatedpost_unique')],
+            },
+        ),
+        migrations.CreateModel(
+            name='RelatedProject',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField()),
+                ('source', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_entries', to='main.project')),
+                ('target', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_from', to='main.project')),
+            ],
+            options={
+                'ordering': ['source', '-score'],
+                'indexes': [models.Index(fields=['source', '-score'], name='relatedproject_rank_idx')],
+                'constraints': [models.UniqueConstraint(fields=('source', 'target'), name='relatedproject_unique')],
+            },
+        ),
+    ]
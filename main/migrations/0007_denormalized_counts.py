@@ -0,0 +1,38 @@
+# Generated by Django 5.2.2 on 2026-10-18 20:02
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def populate_counts(apps, schema_editor):
+    Technology = apps.get_model('main', 'Technology')
+    Tag = apps.get_model('main', 'Tag')
+    technologies = list(Technology.objects.annotate(count=Count('projects', distinct=True)))
+    for technology in technologies:
+        technology.project_count = technology.count
+    Technology.objects.bulk_update(technologies, ['project_count'], batch_size=500)
+    tags = list(Tag.objects.annotate(count=Count('blog_posts', filter=Q(blog_posts__published=True), distinct=True)))
+    for tag in tags:
+        tag.post_count = tag.count
+    Tag.objects.bulk_update(tags, ['post_count'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0006_related_content'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tag',
+            name='post_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Published posts; maintained by signals'),
+        ),
+        migrations.AddField(
+            model_name='technology',
+            name='project_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Maintained by signals; see main/aggregates.py'),
+        ),
+        migrations.RunPython(populate_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,85 @@
+# Generated by Django 5.2.2 on 2026-10-18 20:12
+
+import json
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def legacy_entries(text):
+    """Entries of the old JSON array: URL strings or {"url"/"image", "caption"} objects"""
+    if not text.strip():
+        return []
+    try:
+        entries = json.loads(text)
+    except ValueError:
+        # Not JSON; treat it as a whitespace/comma separated list of URLs
+        entries = text.replace(',', ' ').split()
+    if not isinstance(entries, list):
+        entries = [entries]
+    return [entry if isinstance(entry, dict) else {'url': str(entry)} for entry in entries]
+
+
+def copy_screenshots(apps, schema_editor):
+    Project = apps.get_model('main', 'Project')
+    ProjectScreenshot = apps.get_model('main', 'ProjectScreenshot')
+    screenshots = []
+    for project_id, text in Project.objects.exclude(screenshots='').values_list('pk', 'screenshots'):
+        for position, entry in enumerate(legacy_entries(text)):
+            location = str(entry.get('url') or entry.get('image') or entry.get('src') or '')
+            if not location:
+                continue
+            # Absolute URLs stay links; anything else is a path inside MEDIA_ROOT
+            uploaded = not location.startswith(('http://', 'https://', '/'))
+            screenshots.append(ProjectScreenshot(
+                project_id=project_id,
+                image=location if uploaded else '',
+                url='' if uploaded else location,
+                caption=str(entry.get('caption', ''))[:200],
+                position=position,
+            ))
+    ProjectScreenshot.objects.bulk_create(screenshots, batch_size=500)
+
+
+def restore_screenshots(apps, schema_editor):
+    Project = apps.get_model('main', 'Project')
+    ProjectScreenshot = apps.get_model('main', 'ProjectScreenshot')
+    by_project = {}
+    for screenshot in ProjectScreenshot.objects.order_by('project', 'position', 'id'):
+        by_project.setdefault(screenshot.project_id, []).append(screenshot.image.name or screenshot.url)
+    for project_id, urls in by_project.items():
+        Project.objects.filter(pk=project_id).update(screenshots=json.dumps(urls))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0008_project_thumbnail_variants'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectScreenshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('image', models.ImageField(blank=True, upload_to='project_screenshots/')),
+                ('url', models.URLField(blank=True, help_text='External image, used when nothing is uploaded', max_length=500)),
+                ('caption', models.CharField(blank=True, max_length=200)),
+                ('position', models.PositiveIntegerField(default=0, help_text='Lower numbers show first')),
+                ('width', models.PositiveIntegerField(blank=True, null=True)),
+                ('height', models.PositiveIntegerField(blank=True, null=True)),
+                ('variants', models.JSONField(blank=True, default=dict, editable=False, help_text='Resized copies; see main/images.py')),
+                ('updated_date', models.DateTimeField(auto_now=True)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='screenshots', to='main.project')),
+            ],
+            options={
+                'ordering': ['position', 'id'],
+                'indexes': [models.Index(fields=['project', 'position', 'id'], name='screenshot_order_idx')],
+            },
+        ),
+        migrations.RunPython(copy_screenshots, restore_screenshots),
+        migrations.RemoveField(
+            model_name='project',
+            name='screenshots',
+        ),
+    ]
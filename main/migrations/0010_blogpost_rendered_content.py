@@ -0,0 +1,37 @@
+# Generated by Django 5.2.2 on 2026-10-18 20:21
+
+from django.db import migrations, models
+
+# Existing posts are rendered by `manage.py render_blog_content` (run on deploy),
+# not here: the Markdown/sanitizer code and its packages change over time, and
+# a migration has to behave the same on every fresh install.
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0009_project_screenshots'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpost',
+            name='content_html',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='reading_time',
+            field=models.PositiveSmallIntegerField(default=1, editable=False, help_text='Minutes'),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='summary',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -1,3 +1,6 @@
+import warnings
+
+from django.conf import settings
 from django.db import models
 from django.contrib.auth.models import User
 from django.urls import reverse
@@ -5,6 +8,33 @@ from django.db import models
 from django.contrib.auth.models import User
 from django.urls import reverse
 from django.utils import timezone
+from django.core.exceptions import ValidationError
+from django.contrib.postgres.search import SearchVectorField
+
+class DeferredFieldWarning(RuntimeWarning):
+    """A field left out of a listing query was loaded with a query of its own"""
+
+class DeferredFieldGuard(models.Model):
+    """Warns when a deferred field is loaded, which costs one query per row
+    
+    Listing querysets defer the large text columns; touching one of them
+    in a template or serializer would quietly turn a page into N+1
+    queries. On with DEBUG or WARN_DEFERRED_FIELDS.
+    """
+    
+    class Meta:
+        abstract = True
+    
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        if fields and getattr(settings, 'WARN_DEFERRED_FIELDS', settings.DEBUG):
+            loading = set(fields) & self.get_deferred_fields()
+            if loading:
+                warnings.warn(
+                    f"{type(self).__name__}.{', '.join(sorted(loading))} was deferred by the "
+                    f"queryset and is being loaded with an extra query",
+                    DeferredFieldWarning, stacklevel=3,
+                )
+        return super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
 
 class Technology(models.Model):
     """Technology/skill model for organizing projects"""
@@ -19,6 +49,8 @@ class Technology(models.Model):
         ('other', 'Other'),
     ])
     color = models.CharField(max_length=7, default='#3498db', help_text='Hex color for UI')
+    project_count = models.PositiveIntegerField(default=0, editable=False, help_text='Maintained by signals; see main/aggregates.py')
+    updated_date = models.DateTimeField(auto_now=True)
     
     class Meta:
         ordering = ['category', 'name']
@@ -32,6 +64,8 @@ class Tag(models.Model):
     name = models.CharField(max_length=50, unique=True)
     slug = models.SlugField(unique=True)
     description = models.TextField(blank=True)
+    post_count = models.PositiveIntegerField(default=0, editable=False, help_text='Published posts; maintained by signals')
+    updated_date = models.DateTimeField(auto_now=True)
     
     class Meta:
         ordering = ['name']
@@ -39,7 +73,34 @@ class Tag(models.Model):
     def __str__(self):
         return self.name
 
-class Project(models.Model):
+class ProjectQuerySet(models.QuerySet):
+    """Shared query helpers for the HTML and API project views"""
+    
+    def with_technologies(self):
+        """Prefetch technologies so serializers/templates don't query per project"""
+        return self.prefetch_related('technologies')
+    
+    def without_bodies(self):
+        """Skip the long description no listing renders"""
+        return self.defer('detailed_description')
+    
+    def for_listing(self):
+        """Listing rows: technologies prefetched, long text left in the database"""
+        return self.with_technologies().without_bodies()
+    
+    def for_detail(self):
+        """Technologies and ordered screenshots, one query each"""
+        return self.with_technologies().prefetch_related('screenshots')
+    
+    def related_to(self, project):
+        """Projects most similar to `project`, best first, from the precomputed index"""
+        return self.filter(related_from__source=project).order_by('-related_from__score')
+    
+    def listing_as_related(self, project):
+        """Projects whose related list includes `project`"""
+        return self.filter(related_entries__target=project)
+
+class Project(DeferredFieldGuard):
     """Main project model for portfolio"""
     title = models.CharField(max_length=200)
     slug = models.SlugField(unique=True, help_text='URL-friendly version of title')
@@ -65,15 +126,24 @@ class Project(models.Model):
     
     # Media
     thumbnail = models.ImageField(upload_to='project_thumbnails/', blank=True)
-    screenshots = models.TextField(blank=True, help_text='JSON array of screenshot URLs')
+    thumbnail_variants = models.JSONField(default=dict, blank=True, editable=False, help_text='Resized copies; see main/images.py')
     
     # Metadata
     created_date = models.DateTimeField(auto_now_add=True)
     updated_date = models.DateTimeField(auto_now=True)
     completion_date = models.DateField(blank=True, null=True)
     
+    objects = ProjectQuerySet.as_manager()
+    
     class Meta:
         ordering = ['-priority', '-created_date']
+        indexes = [
+            # Listing order, with id as the keyset pagination tiebreaker
+            models.Index(fields=['-priority', '-created_date', 'id'], name='project_listing_idx'),
+            # Homepage/API featured filter and the status filter
+            models.Index(fields=['featured', 'status', '-priority', '-created_date'], name='project_featured_idx'),
+            models.Index(fields=['status', '-priority', '-created_date'], name='project_status_idx'),
+        ]
     
     def __str__(self):
         return self.title
@@ -81,7 +151,80 @@ class Project(models.Model):
     def get_absolute_url(self):
         return reverse('project_detail', kwargs={'slug': self.slug})
 
-class BlogPost(models.Model):
+class ProjectScreenshot(models.Model):
+    """Ordered project screenshot, uploaded or linked by URL"""
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='screenshots')
+    image = models.ImageField(upload_to='project_screenshots/', blank=True)
+    url = models.URLField(max_length=500, blank=True, help_text='External image, used when nothing is uploaded')
+    caption = models.CharField(max_length=200, blank=True)
+    position = models.PositiveIntegerField(default=0, help_text='Lower numbers show first')
+    
+    # Known without fetching the image, so pages can reserve space for it. Filled
+    # in by the variant pipeline (not width_field, which opens the file on load)
+    width = models.PositiveIntegerField(blank=True, null=True)
+    height = models.PositiveIntegerField(blank=True, null=True)
+    variants = models.JSONField(default=dict, blank=True, editable=False, help_text='Resized copies; see main/images.py')
+    
+    updated_date = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        ordering = ['position', 'id']
+        indexes = [
+            models.Index(fields=['project', 'position', 'id'], name='screenshot_order_idx'),
+        ]
+    
+    def __str__(self):
+        return self.caption or f'{self.project} screenshot {self.position}'
+    
+    def clean(self):
+        if not self.image and not self.url:
+            raise ValidationError('Upload an image or enter its URL.')
+    
+    @property
+    def src(self):
+        return self.image.url if self.image else self.url
+    
+    @property
+    def placeholder(self):
+        """Average colour of the image, once its variants have been generated"""
+        if self.image and self.variants.get('source') == self.image.name:
+            return self.variants.get('placeholder')
+        return None
+
+class BlogPostQuerySet(models.QuerySet):
+    """Shared query helpers for the HTML and API blog views"""
+    
+    def published(self):
+        return self.filter(published=True)
+    
+    def with_tags(self):
+        """Prefetch tags so serializers/templates don't query per post"""
+        return self.prefetch_related('tags')
+    
+    def without_bodies(self):
+        """Skip the post body columns; listings show `summary` instead"""
+        return self.defer('content', 'content_html', 'search_vector')
+    
+    def for_listing(self):
+        """Everything a blog listing row renders, in a fixed number of queries"""
+        return self.with_tags().without_bodies().select_related('related_project').prefetch_related(
+            'related_technologies'
+        ).defer('related_project__detailed_description')
+    
+    def for_detail(self):
+        return self.with_tags().select_related('related_project').prefetch_related(
+            'related_technologies'
+        )
+    
+    def related_to(self, post):
+        """Published posts most similar to `post`, best first, from the precomputed index"""
+        return self.filter(related_from__source=post).order_by('-related_from__score')
+    
+    def listing_as_related(self, post):
+        """Posts whose related list includes `post`"""
+        return self.filter(related_entries__target=post)
+
+class BlogPost(DeferredFieldGuard):
     """Blog/learning journal for documenting progress"""
     title = models.CharField(max_length=200)
     slug = models.SlugField(unique=True)
@@ -111,8 +254,32 @@ class BlogPost(models.Model):
     # Engagement
     views = models.PositiveIntegerField(default=0)
     
+    # Derived from content/excerpt on save (see main/content.py)
+    content_html = models.TextField(blank=True, editable=False)
+    summary = models.TextField(blank=True, editable=False)
+    word_count = models.PositiveIntegerField(default=0, editable=False)
+    reading_time = models.PositiveSmallIntegerField(default=1, editable=False, help_text='Minutes')
+    
+    # Full-text search (PostgreSQL only; see main/search.py)
+    search_vector = SearchVectorField(null=True, editable=False)
+    
+    objects = BlogPostQuerySet.as_manager()
+    
     class Meta:
         ordering = ['-published_date', '-created_date']
+        indexes = [
+            # Only published posts are ever listed, so index just those
+            models.Index(
+                fields=['-published_date', '-created_date', 'id'],
+                condition=models.Q(published=True),
+                name='blogpost_published_idx',
+            ),
+            models.Index(
+                fields=['category', '-published_date', '-created_date'],
+                condition=models.Q(published=True),
+                name='blogpost_category_idx',
+            ),
+        ]
     
     def __str__(self):
         return self.title
@@ -120,7 +287,22 @@ class BlogPost(models.Model):
     def save(self, *args, **kwargs):
         if self.published and not self.published_date:
             self.published_date = timezone.now()
+        
+        # Render once here so listings and detail pages never parse Markdown
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or set(update_fields) & {'excerpt', 'content'}:
+            from .content import render_post
+            rendered = render_post(self.content, self.excerpt)
+            for field, value in rendered.items():
+                setattr(self, field, value)
+            if update_fields is not None:
+                kwargs['update_fields'] = update_fields = set(update_fields) | set(rendered)
         super().save(*args, **kwargs)
+        
+        # Keep the search index in step with the searchable text
+        if update_fields is None or set(update_fields) & {'title', 'excerpt', 'content'}:
+            from .search import get_search_backend
+            get_search_backend().index(self)
     
     def get_absolute_url(self):
         return reverse('blog_detail', kwargs={'slug': self.slug})
@@ -147,9 +329,17 @@ class Skill(models.Model):
     years_experience = models.DecimalField(max_digits=3, decimal_places=1, default=0)
     description = models.TextField(blank=True)
     show_on_resume = models.BooleanField(default=True)
+    updated_date = models.DateTimeField(auto_now=True)
     
     class Meta:
         ordering = ['category', '-years_experience', 'name']
+        indexes = [
+            models.Index(
+                fields=['category', '-years_experience', 'name'],
+                condition=models.Q(show_on_resume=True),
+                name='skill_resume_idx',
+            ),
+        ]
     
     def __str__(self):
         return f"{self.name} ({self.proficiency})"
@@ -168,4 +358,41 @@ class Contact(models.Model):
         ordering = ['-created_date']
     
     def __str__(self):
-        return f"Contact from {self.name} - {self.subject}"
\ No newline at end of file
+        return f"Contact from {self.name} - {self.subject}"
+
+class RelatedProject(models.Model):
+    """Precomputed "related projects" entry, ranked by score (see main/related.py)"""
+    source = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='related_entries')
+    target = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='related_from')
+    score = models.FloatField()
+    
+    class Meta:
+        ordering = ['source', '-score']
+        constraints = [
+            models.UniqueConstraint(fields=['source', 'target'], name='relatedproject_unique'),
+        ]
+        indexes = [
+            # Detail pages read one source's entries best-first
+            models.Index(fields=['source', '-score'], name='relatedproject_rank_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.source} -> {self.target} ({self.score:.2f})"
+
+class RelatedPost(models.Model):
+    """Precomputed "related posts" entry, ranked by score (see main/related.py)"""
+    source = models.ForeignKey(BlogPost, on_delete=models.CASCADE, related_name='related_entries')
+    target = models.ForeignKey(BlogPost, on_delete=models.CASCADE, related_name='related_from')
+    score = models.FloatField()
+    
+    class Meta:
+        ordering = ['source', '-score']
+        constraints = [
+            models.UniqueConstraint(fields=['source', 'target'], name='relatedpost_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['source', '-score'], name='relatedpost_rank_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.source} -> {self.target} ({self.score:.2f})"
@@ -0,0 +1,162 @@
+import base64
+import datetime
+import json
+from functools import reduce
+from operator import and_, or_
+
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """Cursor pagination that seeks on the full ordering instead of OFFSET
+
+    The ordering is the view's `keyset_ordering` (or the model's
+    Meta.ordering) with the primary key appended as a tiebreaker, so every
+    position is unique and a page at any depth is a single indexed range
+    scan with no COUNT(*). NULLs sort after every other value.
+    """
+
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    invalid_cursor_message = 'Invalid cursor'
+
+    def get_page_size(self, request):
+        page_size = api_settings.PAGE_SIZE or 20
+        if self.page_size_query_param in request.query_params:
+            try:
+                page_size = int(request.query_params[self.page_size_query_param])
+            except ValueError:
+                pass
+        return max(1, min(page_size, self.max_page_size))
+
+    def get_ordering(self, view, queryset):
+        ordering = list(getattr(view, 'keyset_ordering', None) or queryset.model._meta.ordering)
+        if not any(field.lstrip('-') in ('pk', 'id') for field in ordering):
+            ordering.append('pk')
+        return [(field.lstrip('-'), field.startswith('-')) for field in ordering]
+
+    def paginate_queryset(self, queryset, request, view=None):
+        queryset, position, reverse = self.page_queryset(queryset, request, view)
+        return self.set_page(list(queryset), position, reverse)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """paginate_queryset for async views, fetching through the async ORM"""
+        queryset, position, reverse = self.page_queryset(queryset, request, view)
+        return self.set_page([row async for row in queryset], position, reverse)
+
+    def page_queryset(self, queryset, request, view):
+        """The unevaluated query for the requested page, plus one row to detect more"""
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(view, queryset)
+        self.model = queryset.model
+
+        position, reverse = self.decode_cursor(request)
+        ordering = [(field, descending != reverse) for field, descending in self.ordering]
+        queryset = queryset.order_by(*[
+            self.order_expression(field, descending, reverse) for field, descending in ordering
+        ])
+        if position is not None:
+            queryset = queryset.filter(self.after(ordering, position, nulls_last=not reverse))
+        return queryset[:self.page_size + 1], position, reverse
+
+    def set_page(self, rows, position, reverse):
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+            self.has_next, self.has_previous = position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+        self.page = rows
+        return rows
+
+    def order_expression(self, field, descending, reverse):
+        expression = F(field).desc if descending else F(field).asc
+        # Only nullable columns get a NULLS clause, so plain indexes still match
+        if field != 'pk' and self.model._meta.get_field(field).null:
+            return expression(**({'nulls_first': True} if reverse else {'nulls_last': True}))
+        return expression()
+
+    @staticmethod
+    def after(ordering, position, nulls_last):
+        """Q matching rows strictly after `position` in `ordering`"""
+        clauses = []
+        equal = []
+        for (field, descending), value in zip(ordering, position):
+            if value is None:
+                # NULLs sit at one end; only the other end can follow them
+                beyond = None if nulls_last else Q(**{f'{field}__isnull': False})
+                same = Q(**{f'{field}__isnull': True})
+            else:
+                beyond = Q(**{f"{field}__{'lt' if descending else 'gt'}": value})
+                if nulls_last:
+                    beyond |= Q(**{f'{field}__isnull': True})
+                same = Q(**{field: value})
+            if beyond is not None:
+                clauses.append(reduce(and_, equal + [beyond]))
+            equal.append(same)
+        return reduce(or_, clauses) if clauses else Q(pk__in=[])
+
+    def position_of(self, row):
+        if isinstance(row, dict):  # values() rows, see main/row_serializers.py
+            return [row[field] for field, _ in self.ordering]
+        return [getattr(row, field) for field, _ in self.ordering]
+
+    @staticmethod
+    def encode_value(value):
+        # Full-precision isoformat; DjangoJSONEncoder would drop microseconds
+        if isinstance(value, (datetime.date, datetime.time)):
+            return value.isoformat()
+        return str(value)
+
+    def encode_cursor(self, position, reverse):
+        payload = json.dumps({'p': position, 'r': reverse}, default=self.encode_value)
+        cursor = base64.urlsafe_b64encode(payload.encode()).decode()
+        return replace_query_param(
+            self.request.build_absolute_uri(), self.cursor_query_param, cursor
+        )
+
+    def decode_cursor(self, request):
+        cursor = request.query_params.get(self.cursor_query_param)
+        if not cursor:
+            return None, False
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            raw_position, reverse = payload['p'], bool(payload['r'])
+            if len(raw_position) != len(self.ordering):
+                raise ValueError
+            opts = self.model._meta
+            position = [
+                None if value is None else
+                (opts.pk if field == 'pk' else opts.get_field(field)).to_python(value)
+                for (field, _), value in zip(self.ordering, raw_position)
+            ]
+        except Exception:
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.position_of(self.page[-1]), reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.request.build_absolute_uri(), self.cursor_query_param)
+        return self.encode_cursor(self.position_of(self.page[0]), reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
@@ -0,0 +1,107 @@
+import re
+
+from django.db import connection, transaction
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from .models import BlogPost, Project, Skill
+
+# Hot listing endpoints and the filters they are called with
+ENDPOINTS = [
+    ('home', {}),
+    ('projects', {}),
+    ('projects', {'status': 'completed'}),
+    ('blog', {}),
+    ('blog', {'category': 'learning'}),
+    ('about', {}),
+    ('api_project_list', {}),
+    ('api_project_list', {'featured': 'true'}),
+    ('api_project_list', {'status': 'completed'}),
+    ('api_blog_list', {}),
+    ('api_blog_list', {'category': 'learning'}),
+    ('api_skill_list', {}),
+    ('api_skill_list', {'category': 'programming'}),
+]
+
+INDEXED_TABLES = ['main_project', 'main_blogpost', 'main_skill']
+
+FROM_TABLE = re.compile(r'\bFROM "?(\w+)"?', re.IGNORECASE)
+
+
+def capture_endpoint_queries(url_name, params):
+    """SELECTs an endpoint runs against the indexed tables, bypassing the page cache"""
+    dummy_cache = {'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}}
+    with override_settings(CACHES=dummy_cache), CaptureQueriesContext(connection) as captured:
+        Client().get(reverse(url_name), params)
+    queries = []
+    for query in captured.captured_queries:
+        sql = query['sql']
+        match = FROM_TABLE.search(sql)
+        if sql.startswith('SELECT') and match and match.group(1) in INDEXED_TABLES:
+            queries.append((match.group(1), sql))
+    return queries
+
+
+def explain(table, sql):
+    """Plan summary for one query: which index it uses and whether it sorts"""
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+            lines = [row[-1] for row in cursor.fetchall()]
+            table_lines = [line for line in lines if re.search(rf'\b{table}\b', line)]
+            index = next(
+                (re.search(r'USING (?:COVERING )?INDEX (\w+)', line).group(1)
+                 for line in table_lines if 'INDEX' in line),
+                None
+            )
+            sorts = any('TEMP B-TREE FOR ORDER BY' in line for line in lines)
+        else:
+            cursor.execute(f'EXPLAIN {sql}')
+            lines = [row[0] for row in cursor.fetchall()]
+            index = next(
+                (re.search(r'Index (?:Only )?Scan (?:Backward )?using (\w+)', line).group(1)
+                 for line in lines if re.search(r'Index (?:Only )?Scan (?:Backward )?using', line)),
+                None
+            )
+            if index is None:
+                index = next(
+                    (re.search(r'Bitmap Index Scan on (\w+)', line).group(1)
+                     for line in lines if 'Bitmap Index Scan on' in line),
+                    None
+                )
+            sorts = any(line.strip().startswith('Sort') or '->  Sort' in line for line in lines)
+    return {'index': index, 'sorts': sorts, 'plan': lines}
+
+
+def seed_sample_rows():
+    """Views skip their listing query on empty tables, so make sure each has a row"""
+    if not Project.objects.exists():
+        Project.objects.create(title='Sample', slug='explain-sample', description='Sample')
+    if not BlogPost.objects.filter(published=True).exists():
+        BlogPost.objects.create(title='Sample', slug='explain-sample', content='Sample', published=True)
+    if not Skill.objects.filter(show_on_resume=True).exists():
+        Skill.objects.create(name='Sample', category='programming', proficiency='beginner')
+
+
+def explain_endpoints(endpoints=ENDPOINTS):
+    """EXPLAIN every indexed-table query issued by each endpoint
+
+    Runs in a transaction that is rolled back, so sample rows never persist.
+    """
+    results = []
+    with transaction.atomic():
+        seed_sample_rows()
+        for url_name, params in endpoints:
+            for table, sql in capture_endpoint_queries(url_name, params):
+                plan = explain(table, sql)
+                results.append({
+                    'endpoint': url_name,
+                    'params': params,
+                    'table': table,
+                    'ordered': ' ORDER BY ' in sql,
+                    'sql': sql,
+                    **plan,
+                })
+        transaction.set_rollback(True)
+    return results
@@ -0,0 +1,233 @@
+import math
+import re
+from collections import Counter
+
+from django.apps import apps as global_apps
+from django.conf import settings
+from django.db import transaction
+
+WORD = re.compile(r'[a-z0-9]{3,}')
+
+
+def jaccard(a, b):
+    """Overlap of two feature sets, 0 (nothing shared) to 1 (identical)"""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class RelatedIndex:
+    """Stores each item's top-scoring similar items in an entry table
+
+    Detail pages then read ranked related items with one indexed lookup
+    on (source, -score) instead of a join + DISTINCT per request. Scores
+    are the Jaccard overlap of the items' features (technologies, tags).
+    `refresh(ids)` recomputes the given items and every item whose list
+    could change with them; signals call it on m2m_changed/save/delete.
+    """
+
+    model_name = None
+    entry_model_name = None
+    relations = []  # (m2m field, feature prefix)
+
+    def __init__(self, apps=global_apps):
+        self.model = apps.get_model('main', self.model_name)
+        self.entry_model = apps.get_model('main', self.entry_model_name)
+
+    @property
+    def limit(self):
+        return getattr(settings, 'RELATED_CONTENT_LIMIT', 6)
+
+    def eligible(self):
+        """Items that get a related list and may appear in one"""
+        return self.model._default_manager.all()
+
+    def features(self, ids):
+        """{id: set of features} for the given item ids, one query per relation"""
+        features = {pk: set() for pk in ids}
+        for field, prefix in self.relations:
+            through = getattr(self.model, field).through
+            owner = f'{self.model._meta.model_name}_id'
+            related = f'{getattr(self.model, field).field.related_model._meta.model_name}_id'
+            for owner_id, related_id in through.objects.filter(
+                **{f'{owner}__in': ids}
+            ).values_list(owner, related).iterator():
+                features[owner_id].add((prefix, related_id))
+        return features
+
+    def sharing_features(self, ids):
+        """Ids of items sharing at least one feature with any of `ids`"""
+        sharing = set()
+        for field, _ in self.relations:
+            through = getattr(self.model, field).through
+            owner = f'{self.model._meta.model_name}_id'
+            related = f'{getattr(self.model, field).field.related_model._meta.model_name}_id'
+            related_ids = through.objects.filter(**{f'{owner}__in': ids}).values(related)
+            sharing.update(
+                through.objects.filter(**{f'{related}__in': related_ids}).values_list(owner, flat=True)
+            )
+        return sharing
+
+    def candidates(self, source_ids):
+        return self.sharing_features(source_ids)
+
+    def score(self, source, target, features):
+        return jaccard(features[source], features[target])
+
+    def refresh(self, ids):
+        """Recompute the lists of `ids` and patch the lists their scores appear in
+
+        Only pairs involving a changed item can change score, so other
+        lists are updated in place; a list is recomputed in full only when
+        one of its entries drops while the list is full, since an unlisted
+        item might now outrank it.
+        """
+        ids = set(ids)
+        if not ids:
+            return
+        neighbours = self.candidates(ids) | set(
+            self.entry_model._default_manager.filter(target_id__in=ids).values_list('source_id', flat=True)
+        )
+        self.recompute(ids)
+        self.update_lists(neighbours - ids, ids)
+
+    def rebuild(self):
+        self.entry_model._default_manager.all().delete()
+        self.recompute(set(self.eligible().values_list('pk', flat=True)))
+
+    def recompute(self, source_ids):
+        """Score every candidate for each source and store the best `limit`"""
+        eligible = set(self.eligible().filter(pk__in=source_ids).values_list('pk', flat=True))
+        candidates = set(self.eligible().filter(pk__in=self.candidates(eligible)).values_list('pk', flat=True))
+        features = self.features(eligible | candidates)
+        self.prepare(eligible | candidates)
+
+        lists = {}
+        for source in eligible:
+            lists[source] = self.best(
+                (target, self.score(source, target, features)) for target in candidates if target != source
+            )
+        self.store(source_ids, lists)
+
+    def update_lists(self, source_ids, changed_ids):
+        """Re-score only the (source, changed item) pairs of existing lists"""
+        if not source_ids:
+            return
+        eligible = set(self.eligible().filter(pk__in=source_ids).values_list('pk', flat=True))
+        changed = set(self.eligible().filter(pk__in=changed_ids).values_list('pk', flat=True))
+        features = self.features(eligible | changed)
+        self.prepare(eligible | changed)
+        current = {source: {} for source in eligible}
+        for source, target, score in self.entry_model._default_manager.filter(
+            source_id__in=eligible
+        ).values_list('source_id', 'target_id', 'score'):
+            current[source][target] = score
+
+        lists, full_recompute = {}, set(source_ids) - eligible
+        for source in eligible:
+            entries = dict(current[source])
+            was_full = len(entries) >= self.limit
+            for target in changed_ids:
+                if target == source:
+                    continue
+                new = self.score(source, target, features) if target in changed else 0.0
+                old = entries.pop(target, None)
+                if was_full and old is not None and new < old:
+                    full_recompute.add(source)
+                    break
+                entries[target] = new
+            else:
+                ranked = dict(self.best(entries.items()))
+                if ranked != current[source]:
+                    lists[source] = ranked.items()
+        self.store(lists.keys(), lists)
+        if full_recompute:
+            self.recompute(full_recompute)
+
+    def best(self, scored):
+        """The top `limit` (target, score) pairs with a positive score"""
+        ranked = sorted((item for item in scored if item[1] > 0), key=lambda item: (-item[1], item[0]))
+        return ranked[:self.limit]
+
+    def store(self, source_ids, lists):
+        """Replace the entries of `source_ids` with `lists` ({source: [(target, score)]})"""
+        source_ids = list(source_ids)
+        if not source_ids:
+            return
+        entries = [
+            self.entry_model(source_id=source, target_id=target, score=score)
+            for source, ranked in lists.items() for target, score in ranked
+        ]
+        with transaction.atomic():
+            self.entry_model._default_manager.filter(source_id__in=source_ids).delete()
+            self.entry_model._default_manager.bulk_create(entries)
+
+    def prepare(self, ids):
+        """Hook for subclasses that need extra data before scoring"""
+
+
+class ProjectRelatedIndex(RelatedIndex):
+    model_name = 'Project'
+    entry_model_name = 'RelatedProject'
+    relations = [('technologies', 'technology')]
+
+
+class PostRelatedIndex(RelatedIndex):
+    """Published posts, related by shared tags and technologies
+
+    With RELATED_CONTENT_TFIDF on, the cosine similarity of the posts'
+    TF-IDF vectors (title, excerpt, content) is blended in, so posts with
+    similar text relate even without shared tags. Document frequencies are
+    recomputed from all published posts on every refresh, but lists an
+    edit doesn't touch keep their older scores until `rebuild_related`.
+    """
+
+    model_name = 'BlogPost'
+    entry_model_name = 'RelatedPost'
+    relations = [('tags', 'tag'), ('related_technologies', 'technology')]
+    text_weight = 0.5
+
+    @property
+    def use_tfidf(self):
+        return getattr(settings, 'RELATED_CONTENT_TFIDF', False)
+
+    def eligible(self):
+        return self.model._default_manager.filter(published=True)
+
+    def candidates(self, source_ids):
+        if self.use_tfidf:
+            return set(self.eligible().values_list('pk', flat=True))
+        return super().candidates(source_ids)
+
+    def prepare(self, ids):
+        self.vectors = {}
+        self.tfidf = self.use_tfidf
+        if not self.tfidf:
+            return
+        documents = {}
+        for pk, title, excerpt, content in self.eligible().values_list('pk', 'title', 'excerpt', 'content').iterator():
+            documents[pk] = Counter(WORD.findall(f'{title} {excerpt} {content}'.lower()))
+        document_frequency = Counter(word for terms in documents.values() for word in terms)
+        total = len(documents)
+        for pk in ids:
+            terms = documents.get(pk, Counter())
+            vector = {
+                word: count * (math.log((1 + total) / (1 + document_frequency[word])) + 1)
+                for word, count in terms.items()
+            }
+            norm = math.sqrt(sum(weight * weight for weight in vector.values())) or 1.0
+            self.vectors[pk] = {word: weight / norm for word, weight in vector.items()}
+
+    def score(self, source, target, features):
+        score = super().score(source, target, features)
+        if self.tfidf:
+            a, b = self.vectors.get(source, {}), self.vectors.get(target, {})
+            if len(b) < len(a):
+                a, b = b, a
+            score += self.text_weight * sum(weight * b.get(word, 0.0) for word, weight in a.items())
+        return score
+
+
+def rebuild_related_index(apps=global_apps):
+    for index in (ProjectRelatedIndex(apps), PostRelatedIndex(apps)):
+        index.rebuild()
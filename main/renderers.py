@@ -0,0 +1,37 @@
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # the stock encoder; see FastJSONRenderer
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSONRenderer that encodes with orjson when it is installed
+
+    Produces the same bytes as JSONRenderer's compact UTF-8 output: types
+    orjson would format differently (dates, times, decimals and anything
+    unknown) are handed to DRF's encoder, and integers beyond 64 bits fall
+    back to the stock path, as do indented output (the browsable API) and
+    non-default JSON settings.
+
+    Floats are the exception. NaN and Infinity render as null where the
+    stock renderer raises ValueError (STRICT_JSON), and exponents are
+    written orjson's way (1e16, 0.00001 rather than 1e+16, 1e-05): the
+    same values, different bytes. No API field is a float today; decimals
+    such as Skill.years_experience go through DRF's encoder.
+    """
+
+    options = 0 if orjson is None else (
+        orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS
+    )
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if orjson is None or data is None or indent is not None or not self.compact or self.ensure_ascii:
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            encoded = orjson.dumps(data, default=self.encoder_class().default, option=self.options)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        return encoded.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
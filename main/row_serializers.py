@@ -0,0 +1,181 @@
+from functools import partial
+from operator import itemgetter
+
+from rest_framework import serializers
+
+from .images import srcsets
+from .serializers import (
+    BlogPostListSerializer, ProjectListSerializer, SkillSerializer, TagSerializer, TechnologySerializer
+)
+
+# DRF fields whose to_representation returns a database value unchanged
+PLAIN_FIELDS = (serializers.CharField, serializers.IntegerField, serializers.BooleanField, serializers.ChoiceField)
+
+
+class RowSerializer:
+    """Read-only twin of a ModelSerializer that works on values() rows
+
+    A ModelSerializer builds a model instance per row and then resolves
+    and converts every field through its DRF field object. Here a page is
+    one values() query plus one query per nested many-to-many field, and
+    columns are copied as they come from the database unless the DRF field
+    would change them (dates, decimals, files), in which case that field's
+    own to_representation runs. Output matches `serializer_class` exactly.
+
+    Nested many-to-many fields map to another RowSerializer in `nested`;
+    other computed fields are filled by a `represent_<name>(row)` method
+    reading the columns listed in the serializer's `field_columns`. A
+    Fieldset in the context narrows the columns and relations fetched.
+    """
+
+    serializer_class = None
+    nested = {}  # field name -> RowSerializer of the related rows
+
+    def __init__(self, context=None):
+        self.context = context or {}
+        self.active_plan = self.plan()
+        fieldset = self.context.get('fieldset')
+        if fieldset is not None and fieldset.serializer_class is self.serializer_class:
+            self.active_plan = [
+                (name, 'ids' if kind == 'nested' and not fieldset.embeds(name) else kind, column, convert)
+                for name, kind, column, convert in self.active_plan if name in fieldset.fields
+            ]
+
+    @classmethod
+    def plan(cls):
+        """[(name, kind, column, converter)] for the serializer's fields, built once per class"""
+        if '_plan' not in cls.__dict__:
+            cls._plan = []
+            for name, field in cls.serializer_class().fields.items():
+                if name in cls.nested:
+                    cls._plan.append((name, 'nested', field.source, None))
+                elif hasattr(cls, f'represent_{name}'):
+                    cls._plan.append((name, 'method', None, getattr(cls, f'represent_{name}')))
+                elif isinstance(field, serializers.FileField):
+                    cls._plan.append((name, 'file', field.source, None))
+                elif isinstance(field, PLAIN_FIELDS):
+                    cls._plan.append((name, 'plain', field.source, None))
+                else:
+                    cls._plan.append((name, 'convert', field.source, field.to_representation))
+        return cls._plan
+
+    def columns(self):
+        field_columns = getattr(self.serializer_class, 'field_columns', {})
+        columns = []
+        for name, kind, column, _ in self.active_plan:
+            if kind == 'method':
+                columns.extend(field_columns[name])
+            elif kind not in ('nested', 'ids'):
+                columns.append(column)
+        return columns
+
+    def rows(self, queryset, extra=()):
+        """values() rows for `queryset`, with `extra` columns (e.g. the pagination keys)"""
+        return queryset.prefetch_related(None).values(*dict.fromkeys(['pk', *self.columns(), *extra]))
+
+    def related_queries(self, pks):
+        """{nested field: (owner key, represent(row), query)} fetching the related rows of `pks`
+
+        Each query reads the through table joined to the related model, in
+        the related model's ordering, like prefetch_related would. Fields
+        left out of ?expand= read just the related ids.
+        """
+        model = self.serializer_class.Meta.model
+        queries = {}
+        for name, kind, source, _ in self.active_plan:
+            if kind not in ('nested', 'ids'):
+                continue
+            field = getattr(model, source).field
+            owner, target = field.m2m_field_name(), field.m2m_reverse_field_name()
+            ordering = [
+                f'-{target}__{order[1:]}' if order.startswith('-') else f'{target}__{order}'
+                for order in field.related_model._meta.ordering
+            ]
+            if kind == 'ids':
+                columns = [f'{target}_id']
+                represent = itemgetter(f'{target}_id')
+            else:
+                child = self.nested[name](self.context)
+                columns = [f'{target}__{column}' for column in child.columns()]
+                represent = partial(child.represent, prefix=f'{target}__')
+            query = field.remote_field.through.objects.filter(
+                **{f'{owner}__in': pks}
+            ).order_by(*ordering, 'pk').values(f'{owner}_id', *columns)
+            queries[name] = (f'{owner}_id', represent, query)
+        return queries
+
+    def serialize(self, rows):
+        rows = list(rows)
+        queries = self.related_queries([row['pk'] for row in rows])
+        return self.build(rows, {
+            name: (owner, represent, list(query)) for name, (owner, represent, query) in queries.items()
+        })
+
+    async def aserialize(self, rows):
+        """serialize() for async views, fetching nested rows through the async ORM"""
+        rows = list(rows)
+        queries = self.related_queries([row['pk'] for row in rows])
+        return self.build(rows, {
+            name: (owner, represent, [row async for row in query])
+            for name, (owner, represent, query) in queries.items()
+        })
+
+    def build(self, rows, related_rows):
+        related = {}
+        for name, (owner, represent, related_list) in related_rows.items():
+            grouped = related[name] = {}
+            for row in related_list:
+                grouped.setdefault(row[owner], []).append(represent(row))
+        return [self.represent(row, related=related) for row in rows]
+
+    def represent(self, row, prefix='', related=None):
+        data = {}
+        for name, kind, column, convert in self.active_plan:
+            if kind in ('nested', 'ids'):
+                data[name] = related[name].get(row['pk'], [])
+            elif kind == 'method':
+                data[name] = convert(self, row)
+            else:
+                value = row[prefix + column]
+                if value is None or kind == 'plain':
+                    data[name] = value
+                elif kind == 'file':
+                    # Same as serializers.FileField: None when empty, else the (absolute) URL
+                    data[name] = self.build_url(self.field_file(column, value).url) if value else None
+                else:
+                    data[name] = convert(value)
+        return data
+
+    def build_url(self, url):
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request is not None else url
+
+    def field_file(self, column, name):
+        """The FieldFile a model instance would hold in file column `column`"""
+        field = self.serializer_class.Meta.model._meta.get_field(column)
+        return field.attr_class(None, field, name)
+
+
+class TechnologyRowSerializer(RowSerializer):
+    serializer_class = TechnologySerializer
+
+
+class TagRowSerializer(RowSerializer):
+    serializer_class = TagSerializer
+
+
+class SkillRowSerializer(RowSerializer):
+    serializer_class = SkillSerializer
+
+
+class ProjectListRowSerializer(RowSerializer):
+    serializer_class = ProjectListSerializer
+    nested = {'technologies': TechnologyRowSerializer}
+
+    def represent_thumbnail_srcset(self, row):
+        return srcsets(self.field_file('thumbnail', row['thumbnail']), row['thumbnail_variants'], self.build_url)
+
+
+class BlogPostListRowSerializer(RowSerializer):
+    serializer_class = BlogPostListSerializer
+    nested = {'tags': TagRowSerializer}
@@ -0,0 +1,121 @@
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connection
+from django.db.models import F, Q
+from django.utils.module_loading import import_string
+
+from .models import BlogPost
+
+
+class BaseSearchBackend:
+    """Interface for blog post full-text search
+
+    `index`/`remove` keep the backend's index in step with a single post,
+    `rebuild` reindexes every post, and `search` narrows a BlogPost
+    queryset to matching posts ordered best match first.
+    """
+
+    def index(self, post):
+        pass
+
+    def remove(self, post):
+        pass
+
+    def rebuild(self):
+        pass
+
+    def search(self, queryset, query):
+        raise NotImplementedError
+
+
+class SimpleSearchBackend(BaseSearchBackend):
+    """Unindexed substring match, used when the database has no full-text support"""
+
+    def search(self, queryset, query):
+        return queryset.filter(
+            Q(title__icontains=query) |
+            Q(content__icontains=query) |
+            Q(excerpt__icontains=query)
+        )
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    """Weighted tsvector column behind a GIN index"""
+
+    config = 'english'
+
+    def vector(self):
+        return (
+            SearchVector('title', weight='A', config=self.config) +
+            SearchVector('excerpt', weight='B', config=self.config) +
+            SearchVector('content', weight='C', config=self.config)
+        )
+
+    def index(self, post):
+        type(post).objects.filter(pk=post.pk).update(search_vector=self.vector())
+
+    def rebuild(self):
+        BlogPost.objects.update(search_vector=self.vector())
+
+    def search(self, queryset, query):
+        search_query = SearchQuery(query, config=self.config, search_type='websearch')
+        return queryset.filter(search_vector=search_query).annotate(
+            rank=SearchRank(F('search_vector'), search_query)
+        ).order_by('-rank', *queryset.model._meta.ordering)
+
+
+class SQLiteSearchBackend(BaseSearchBackend):
+    """FTS5 virtual table keyed by post id, for local development"""
+
+    table = f'{BlogPost._meta.db_table}_fts'
+
+    def index(self, post):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.table} WHERE rowid = %s', [post.pk])
+            cursor.execute(
+                f'INSERT INTO {self.table} (rowid, title, excerpt, content) VALUES (%s, %s, %s, %s)',
+                [post.pk, post.title, post.excerpt, post.content]
+            )
+
+    def remove(self, post):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.table} WHERE rowid = %s', [post.pk])
+
+    def rebuild(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.table}')
+            cursor.execute(
+                f'INSERT INTO {self.table} (rowid, title, excerpt, content) '
+                f'SELECT id, title, excerpt, content FROM {BlogPost._meta.db_table}'
+            )
+
+    @staticmethod
+    def match_expression(query):
+        """Quote each word so user input can't inject FTS5 query syntax"""
+        terms = ['"%s"' % word.replace('"', '""') for word in query.split()]
+        return ' '.join(terms)
+
+    def search(self, queryset, query):
+        expression = self.match_expression(query)
+        if not expression:
+            return queryset.none()
+        table = self.table
+        # bm25() is lower for better matches; title/excerpt outweigh content
+        return queryset.extra(
+            tables=[table],
+            where=[f'{table}.rowid = {queryset.model._meta.db_table}.id', f'{table} MATCH %s'],
+            params=[expression],
+            select={'rank': f'bm25({table}, 10.0, 5.0, 1.0)'},
+        ).order_by('rank', *queryset.model._meta.ordering)
+
+
+def get_search_backend():
+    """Backend from BLOG_SEARCH_BACKEND, or the best one for the active database"""
+    backend_path = getattr(settings, 'BLOG_SEARCH_BACKEND', None)
+    if backend_path:
+        return import_string(backend_path)()
+    if connection.vendor == 'postgresql':
+        return PostgresSearchBackend()
+    if connection.vendor == 'sqlite':
+        return SQLiteSearchBackend()
+    return SimpleSearchBackend()
@@ -1,28 +1,73 @@
 # Create this file: main/serializers.py
 
 from rest_framework import serializers
-from .models import Project, Technology, BlogPost, Skill, Contact, Tag
+from .images import srcsets, thumbnail_srcsets
+from .models import Project, ProjectScreenshot, Technology, BlogPost, Skill, Contact, Tag
 
-class TechnologySerializer(serializers.ModelSerializer):
+class FieldsetSerializerMixin(serializers.Serializer):
+    """Serializes only the fields the request's Fieldset selected (see main/fieldsets.py)
+    
+    `field_columns` names the model columns each computed field reads, so
+    views can select just those.
+    """
+    field_columns = {}
+    
+    def get_fields(self):
+        fields = super().get_fields()
+        fieldset = self.context.get('fieldset')
+        if fieldset is None or not fieldset.applies_to(self):
+            return fields
+        return fieldset.apply(fields)
+
+class TechnologySerializer(FieldsetSerializerMixin, serializers.ModelSerializer):
     """Serializer for Technology objects"""
     class Meta:
         model = Technology
-        fields = ['id', 'name', 'category', 'color']
+        fields = ['id', 'name', 'category', 'color', 'project_count']
+
+class ThumbnailSrcsetMixin(serializers.Serializer):
+    """`thumbnail_srcset`: {format: srcset} of resized thumbnail variants"""
+    thumbnail_srcset = serializers.SerializerMethodField()
+    field_columns = {'thumbnail_srcset': ['thumbnail', 'thumbnail_variants']}
+    
+    def get_thumbnail_srcset(self, obj):
+        request = self.context.get('request')
+        return thumbnail_srcsets(obj, request.build_absolute_uri if request is not None else None)
+
+class ProjectScreenshotSerializer(serializers.ModelSerializer):
+    """Screenshot with the metadata needed to lay out a placeholder before loading it"""
+    src = serializers.SerializerMethodField()
+    srcset = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = ProjectScreenshot
+        fields = ['id', 'src', 'srcset', 'caption', 'width', 'height', 'placeholder']
+    
+    def build_url(self, url):
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request is not None else url
+    
+    def get_src(self, obj):
+        return self.build_url(obj.src)
+    
+    def get_srcset(self, obj):
+        return srcsets(obj.image, obj.variants, self.build_url)
 
-class ProjectSerializer(serializers.ModelSerializer):
+class ProjectSerializer(ThumbnailSrcsetMixin, FieldsetSerializerMixin, serializers.ModelSerializer):
     """Serializer for Project objects"""
     technologies = TechnologySerializer(many=True, read_only=True)
+    screenshots = ProjectScreenshotSerializer(many=True, read_only=True)
     
     class Meta:
         model = Project
         fields = [
             'id', 'title', 'slug', 'description', 'detailed_description',
             'technologies', 'status', 'priority', 'featured',
-            'github_url', 'demo_url', 'thumbnail',
+            'github_url', 'demo_url', 'thumbnail', 'thumbnail_srcset', 'screenshots',
             'created_date', 'updated_date', 'completion_date'
         ]
 
-class ProjectListSerializer(serializers.ModelSerializer):
+class ProjectListSerializer(ThumbnailSrcsetMixin, FieldsetSerializerMixin, serializers.ModelSerializer):
     """Simplified serializer for project listings"""
     technologies = TechnologySerializer(many=True, read_only=True)
     
@@ -30,16 +75,16 @@ class ProjectListSerializer(serializers.ModelSerializer):
         model = Project
         fields = [
             'id', 'title', 'slug', 'description', 'technologies',
-            'status', 'featured', 'github_url', 'demo_url', 'thumbnail'
+            'status', 'featured', 'github_url', 'demo_url', 'thumbnail', 'thumbnail_srcset'
         ]
 
-class TagSerializer(serializers.ModelSerializer):
+class TagSerializer(FieldsetSerializerMixin, serializers.ModelSerializer):
     """Serializer for Tag objects"""
     class Meta:
         model = Tag
-        fields = ['id', 'name', 'slug']
+        fields = ['id', 'name', 'slug', 'post_count']
 
-class BlogPostSerializer(serializers.ModelSerializer):
+class BlogPostSerializer(FieldsetSerializerMixin, serializers.ModelSerializer):
     """Serializer for BlogPost objects"""
     tags = TagSerializer(many=True, read_only=True)
     related_technologies = TechnologySerializer(many=True, read_only=True)
@@ -47,23 +92,23 @@ class BlogPostSerializer(serializers.ModelSerializer):
     class Meta:
         model = BlogPost
         fields = [
-            'id', 'title', 'slug', 'content', 'excerpt', 'category',
-            'tags', 'related_technologies', 'published', 'published_date',
-            'created_date', 'views'
+            'id', 'title', 'slug', 'content', 'content_html', 'excerpt', 'summary',
+            'word_count', 'reading_time', 'category', 'tags', 'related_technologies',
+            'published', 'published_date', 'created_date', 'views'
         ]
 
-class BlogPostListSerializer(serializers.ModelSerializer):
+class BlogPostListSerializer(FieldsetSerializerMixin, serializers.ModelSerializer):
     """Simplified serializer for blog post listings"""
     tags = TagSerializer(many=True, read_only=True)
     
     class Meta:
         model = BlogPost
         fields = [
-            'id', 'title', 'slug', 'excerpt', 'category',
-            'tags', 'published_date', 'views'
+            'id', 'title', 'slug', 'excerpt', 'summary', 'reading_time',
+            'category', 'tags', 'published_date', 'views'
         ]
 
-class SkillSerializer(serializers.ModelSerializer):
+class SkillSerializer(FieldsetSerializerMixin, serializers.ModelSerializer):
     """Serializer for Skill objects"""
     class Meta:
         model = Skill
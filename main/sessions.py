@@ -0,0 +1,45 @@
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction
+from django.contrib.sessions.backends.base import SessionBase
+
+
+class SessionlessStore(SessionBase):
+    """An always-empty session that never touches the session backend
+
+    Installed by SelectiveSessionMiddleware for views marked @sessionless:
+    request.user resolves to AnonymousUser without a session lookup and
+    nothing is written back. Writes are discarded, so only use it for
+    views that don't log users in or keep per-visitor state.
+    """
+
+    def load(self):
+        return {}
+
+    def exists(self, session_key):
+        return False
+
+    def create(self):
+        pass
+
+    def save(self, must_create=False):
+        pass
+
+    def delete(self, session_key=None):
+        pass
+
+    @classmethod
+    def clear_expired(cls):
+        pass
+
+
+def sessionless(view_func):
+    """Mark a view as never needing the session, like csrf_exempt marks CSRF"""
+    if iscoroutinefunction(view_func):
+        async def _view_wrapper(request, *args, **kwargs):
+            return await view_func(request, *args, **kwargs)
+    else:
+        def _view_wrapper(request, *args, **kwargs):
+            return view_func(request, *args, **kwargs)
+    _view_wrapper.sessionless = True
+    return wraps(view_func)(_view_wrapper)
@@ -0,0 +1,234 @@
+from django.conf import settings
+from django.core.mail import send_mail
+from django.core.signals import request_finished
+from django.db.backends.signals import connection_created
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .aggregates import invalidate_category_summary, recount_tags, recount_technologies
+from .cache import invalidate_content
+from .contact_queue import contacts_received
+from .images import screenshot_pipeline, thumbnail_pipeline
+from .instrumentation import connection_stats
+from .models import BlogPost, Project, ProjectScreenshot, Skill, Tag, Technology
+from .related import PostRelatedIndex, ProjectRelatedIndex
+from .search import get_search_backend
+
+CACHED_MODELS = [Project, ProjectScreenshot, BlogPost, Skill, Technology, Tag]
+CACHED_RELATIONS = [
+    Project.technologies.through,
+    BlogPost.tags.through,
+    BlogPost.related_technologies.through,
+]
+
+
+@receiver(post_delete, sender=BlogPost)
+def remove_from_search_index(sender, instance, **kwargs):
+    get_search_backend().remove(instance)
+
+
+def content_changed(sender, **kwargs):
+    """Any edit to displayed content drops every cached page and fragment"""
+    action = kwargs.get('action')  # only set for m2m_changed
+    if action is None or action.startswith('post_'):
+        invalidate_content()
+
+
+for model in CACHED_MODELS:
+    post_save.connect(content_changed, sender=model, dispatch_uid=f'content_changed_save_{model.__name__}')
+    post_delete.connect(content_changed, sender=model, dispatch_uid=f'content_changed_delete_{model.__name__}')
+
+for through in CACHED_RELATIONS:
+    m2m_changed.connect(content_changed, sender=through, dispatch_uid=f'content_changed_m2m_{through.__name__}')
+
+
+@receiver(m2m_changed, sender=Project.technologies.through)
+@receiver(m2m_changed, sender=BlogPost.tags.through)
+@receiver(m2m_changed, sender=BlogPost.related_technologies.through)
+def touch_updated_date(sender, instance, action, reverse, model, pk_set, **kwargs):
+    """Relation edits change API payloads, so bump updated_date for ETags"""
+    if not action.startswith('post_'):
+        return
+    if reverse:
+        owner = Project if sender is Project.technologies.through else BlogPost
+        # pk_set is None after a reverse clear(); the owners are unknown by then
+        if pk_set:
+            owner.objects.filter(pk__in=pk_set).update(updated_date=timezone.now())
+    else:
+        type(instance).objects.filter(pk=instance.pk).update(updated_date=timezone.now())
+
+
+@receiver(pre_delete, sender=Technology)
+@receiver(pre_delete, sender=Tag)
+def touch_owners_on_delete(sender, instance, **kwargs):
+    """Deleting a Technology/Tag drops through rows without m2m_changed"""
+    now = timezone.now()
+    if sender is Technology:
+        instance.projects.update(updated_date=now)
+        instance.blogpost_set.update(updated_date=now)
+    else:
+        instance.blog_posts.update(updated_date=now)
+
+
+project_index = ProjectRelatedIndex()
+post_index = PostRelatedIndex()
+RELATED_INDEXES = {
+    Project.technologies.through: project_index,
+    BlogPost.tags.through: post_index,
+    BlogPost.related_technologies.through: post_index,
+}
+RELATED_SAVE_FIELDS = {'published', 'title', 'excerpt', 'content'}
+
+
+@receiver(m2m_changed, sender=Project.technologies.through)
+@receiver(m2m_changed, sender=BlogPost.tags.through)
+@receiver(m2m_changed, sender=BlogPost.related_technologies.through)
+def refresh_related_on_m2m(sender, instance, action, reverse, pk_set, **kwargs):
+    """Technology/tag edits change similarity scores; recompute the affected lists"""
+    index = RELATED_INDEXES[sender]
+    if action == 'pre_clear' and reverse:
+        # pk_set is None after a reverse clear(); remember the owners now
+        instance._related_owner_ids = list(sender.objects.filter(
+            **{f'{type(instance)._meta.model_name}_id': instance.pk}
+        ).values_list(f'{index.model._meta.model_name}_id', flat=True))
+    if not action.startswith('post_'):
+        return
+    if reverse:
+        index.refresh(pk_set if pk_set is not None else instance.__dict__.pop('_related_owner_ids', []))
+    else:
+        index.refresh([instance.pk])
+
+
+@receiver(post_save, sender=BlogPost)
+def refresh_related_on_save(sender, instance, update_fields=None, **kwargs):
+    """Publishing/unpublishing (and text edits, for TF-IDF) change related posts"""
+    if update_fields is None or set(update_fields) & RELATED_SAVE_FIELDS:
+        post_index.refresh([instance.pk])
+
+
+@receiver(pre_delete, sender=Project)
+@receiver(pre_delete, sender=BlogPost)
+@receiver(pre_delete, sender=Technology)
+@receiver(pre_delete, sender=Tag)
+def remember_related_owners(sender, instance, **kwargs):
+    """Lists that lose an entry (or a shared feature) when `instance` is deleted"""
+    if sender is Project:
+        instance._related_refresh = [(project_index, list(instance.related_from.values_list('source_id', flat=True)))]
+    elif sender is BlogPost:
+        instance._related_refresh = [(post_index, list(instance.related_from.values_list('source_id', flat=True)))]
+    elif sender is Technology:
+        instance._related_refresh = [
+            (project_index, list(instance.projects.values_list('pk', flat=True))),
+            (post_index, list(instance.blogpost_set.values_list('pk', flat=True))),
+        ]
+    else:
+        instance._related_refresh = [(post_index, list(instance.blog_posts.values_list('pk', flat=True)))]
+
+
+@receiver(post_delete, sender=Project)
+@receiver(post_delete, sender=BlogPost)
+@receiver(post_delete, sender=Technology)
+@receiver(post_delete, sender=Tag)
+def refresh_related_on_delete(sender, instance, **kwargs):
+    for index, ids in instance.__dict__.pop('_related_refresh', []):
+        index.refresh(ids)
+
+
+COUNTED_RELATIONS = {
+    Project.technologies.through: ('technology_id', recount_technologies),
+    BlogPost.tags.through: ('tag_id', recount_tags),
+}
+
+
+@receiver(m2m_changed, sender=Project.technologies.through)
+@receiver(m2m_changed, sender=BlogPost.tags.through)
+def update_counts_on_m2m(sender, instance, action, reverse, pk_set, **kwargs):
+    """Keep Technology.project_count and Tag.post_count in step with relation edits"""
+    column, recount = COUNTED_RELATIONS[sender]
+    if action == 'pre_clear' and not reverse:
+        # pk_set is None after a forward clear(); remember the counted rows now
+        instance._counted_ids = list(sender.objects.filter(
+            **{f'{type(instance)._meta.model_name}_id': instance.pk}
+        ).values_list(column, flat=True))
+    if not action.startswith('post_'):
+        return
+    if reverse:
+        recount([instance.pk])
+    else:
+        recount(pk_set if pk_set is not None else instance.__dict__.pop('_counted_ids', []))
+
+
+@receiver(post_save, sender=BlogPost)
+def update_counts_on_save(sender, instance, created, update_fields=None, **kwargs):
+    """Publishing/unpublishing changes tag counts and the category summary"""
+    if update_fields is None or {'published', 'category'} & set(update_fields):
+        invalidate_category_summary()
+        if not created:
+            recount_tags(instance.tags.values('pk'))
+
+
+@receiver(pre_delete, sender=Project)
+@receiver(pre_delete, sender=BlogPost)
+def remember_counted_rows(sender, instance, **kwargs):
+    """Deleting a project/post drops through rows without m2m_changed"""
+    if sender is Project:
+        instance._counted_ids = list(instance.technologies.values_list('pk', flat=True))
+    else:
+        instance._counted_ids = list(instance.tags.values_list('pk', flat=True))
+
+
+@receiver(post_delete, sender=Project)
+@receiver(post_delete, sender=BlogPost)
+def update_counts_on_delete(sender, instance, **kwargs):
+    ids = instance.__dict__.pop('_counted_ids', [])
+    if sender is Project:
+        recount_technologies(ids)
+    else:
+        recount_tags(ids)
+        invalidate_category_summary()
+
+
+IMAGE_PIPELINES = {
+    Project: thumbnail_pipeline,
+    ProjectScreenshot: screenshot_pipeline,
+}
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_save, sender=ProjectScreenshot)
+def generate_image_variants(sender, instance, **kwargs):
+    """Resize newly uploaded images; variants are keyed by the file they came from"""
+    IMAGE_PIPELINES[sender].sync(instance)
+
+
+@receiver(post_save, sender=ProjectScreenshot)
+@receiver(post_delete, sender=ProjectScreenshot)
+def touch_project_on_screenshot_change(sender, instance, **kwargs):
+    """Screenshots are part of the project's API payload, so bump it for ETags"""
+    Project.objects.filter(pk=instance.project_id).update(updated_date=timezone.now())
+
+
+@receiver(connection_created)
+def count_connection(sender, connection, **kwargs):
+    connection_stats.connection_opened(connection.alias)
+
+
+@receiver(request_finished)
+def count_request(sender, **kwargs):
+    connection_stats.request_finished()
+
+
+@receiver(contacts_received)
+def email_contact_summary(sender, contacts, **kwargs):
+    """One email per saved batch of contact submissions, sent from the queue's worker thread"""
+    if not settings.CONTACT_NOTIFY_EMAIL:
+        return
+    body = '\n\n'.join(
+        f'From: {contact.name} <{contact.email}>\nSubject: {contact.subject}\n\n{contact.message}'
+        for contact in contacts
+    )
+    send_mail(
+        f'{len(contacts)} new contact message(s)', body,
+        settings.DEFAULT_FROM_EMAIL, [settings.CONTACT_NOTIFY_EMAIL]
+    )
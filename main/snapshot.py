@@ -0,0 +1,92 @@
+import gzip
+import hashlib
+
+from .cache import cache_stats, get_cache, get_timeout, make_key
+from .models import BlogPost, Project, Skill, Technology
+from .renderers import FastJSONRenderer
+from .row_serializers import (
+    BlogPostListRowSerializer, ProjectListRowSerializer, SkillRowSerializer, TechnologyRowSerializer
+)
+
+try:
+    import brotli
+except ImportError:  # gzip only
+    brotli = None
+
+# Best first, which breaks ties between equal q-values; identity is always available
+ENCODINGS = ['br', 'gzip']
+
+
+def snapshot_sections():
+    """{section: (row serializer, queryset)}, matching the list endpoints unfiltered"""
+    return {
+        'projects': (ProjectListRowSerializer, Project.objects.for_listing()),
+        'technologies': (TechnologyRowSerializer, Technology.objects.all()),
+        'blog': (BlogPostListRowSerializer, BlogPost.objects.published().with_tags().without_bodies()),
+        'skills': (SkillRowSerializer, Skill.objects.filter(show_on_resume=True)),
+    }
+
+
+def build_snapshot():
+    """(version, {encoding: body}) for a freshly rendered snapshot document
+
+    The version is a hash of the content, so it only changes when some
+    section does. File URLs are site-relative since no request is involved.
+    """
+    renderer = FastJSONRenderer()
+    data = {}
+    for section, (row_serializer_class, queryset) in snapshot_sections().items():
+        row_serializer = row_serializer_class()
+        data[section] = row_serializer.serialize(row_serializer.rows(queryset))
+    version = hashlib.sha256(renderer.render(data)).hexdigest()[:16]
+    body = renderer.render({'version': version, **data})
+    encoded = {'identity': body, 'gzip': gzip.compress(body, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        encoded['br'] = brotli.compress(body)
+    return version, encoded
+
+
+def get_snapshot():
+    """The current snapshot, rebuilt at most once per content generation
+
+    Like cached pages it is keyed on the content version, so any admin edit
+    starts a new one; view counts, which change without an edit, can lag
+    by up to CONTENT_CACHE_TIMEOUT.
+    """
+    cache = get_cache()
+    key = make_key('snapshot', 'api')
+    snapshot = cache.get(key)
+    cache_stats.record('snapshot', hit=snapshot is not None)
+    if snapshot is None:
+        snapshot = build_snapshot()
+        cache.set(key, snapshot, get_timeout())
+    return snapshot
+
+
+def accepted_encodings(header):
+    """{coding: q-value} from an Accept-Encoding header; a malformed q counts as 0"""
+    accepted = {}
+    for item in header.split(','):
+        coding, *params = [part.strip() for part in item.split(';')]
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding:
+            accepted[coding.lower()] = q
+    return accepted
+
+
+def preferred_encoding(request, encoded):
+    """The client's highest-q encoding among `encoded`, never one it refused with q=0"""
+    accepted = accepted_encodings(request.headers.get('Accept-Encoding', ''))
+    candidates = [
+        (accepted.get(encoding, accepted.get('*', 0)), -rank, encoding)
+        for rank, encoding in enumerate(ENCODINGS) if encoding in encoded
+    ]
+    q, _, encoding = max(candidates, default=(0, 0, 'identity'))
+    return encoding if q > 0 else 'identity'
@@ -0,0 +1,236 @@
+import json
+import math
+from pathlib import Path
+
+from django.test import Client
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .counters import blog_view_counter
+from .models import BlogPost, Project, Skill, Tag, Technology
+from .renderers import FastJSONRenderer
+
+PROJECTS_PER_PAGE = 6  # must match main.views.projects
+POSTS_PER_PAGE = 5  # must match main.views.blog
+API_LISTS = ['projects', 'technologies', 'blog', 'skills']
+EXPORTED_MODELS = (BlogPost, Project, Technology, Tag, Skill)
+
+
+class ExportError(Exception):
+    pass
+
+
+class StaticExporter:
+    """Renders the site through the Django test client into a static tree
+
+    HTML routes become `<path>/index.html` and API responses
+    `<path>/index.json`, so a server that also looks for index.json as the
+    directory index serves both at their live URLs. A manifest of the files
+    written, the export time and each model's primary keys lets later runs
+    re-render only the pages affected by instances edited or deleted since,
+    and delete pages whose objects are gone.
+    """
+
+    MANIFEST = '.export-manifest.json'
+
+    def __init__(self, output_dir, host='localhost', secure=False):
+        self.output_dir = Path(output_dir)
+        self.secure = secure
+        self.client = Client(HTTP_HOST=host)
+
+    # ----- routes -----
+
+    def listing_urls(self, name, count, per_page):
+        pages = max(1, math.ceil(count / per_page))
+        return [f'/{name}/'] + [f'/{name}/page/{page}/' for page in range(2, pages + 1)]
+
+    def project_listing_urls(self):
+        return self.listing_urls('projects', Project.objects.count(), PROJECTS_PER_PAGE)
+
+    def blog_listing_urls(self):
+        return self.listing_urls('blog', BlogPost.objects.published().count(), POSTS_PER_PAGE)
+
+    @staticmethod
+    def project_urls(projects):
+        urls = set()
+        for project in projects:
+            urls |= {project.get_absolute_url(), f'/api/projects/{project.slug}/'}
+        return urls
+
+    @staticmethod
+    def post_urls(posts):
+        urls = set()
+        for post in posts:
+            if post.published:
+                urls |= {post.get_absolute_url(), f'/api/blog/{post.slug}/'}
+        return urls
+
+    def all_urls(self):
+        urls = {'/', '/about/', '/contact/', '/api/', '/api/snapshot/'}
+        urls |= set(self.project_listing_urls()) | set(self.blog_listing_urls())
+        urls |= {f'/api/{name}/' for name in API_LISTS}
+        urls |= self.project_urls(Project.objects.only('slug'))
+        urls |= self.post_urls(BlogPost.objects.published().only('slug', 'published'))
+        return urls
+
+    def affected_urls(self, instance):
+        """Every exported URL whose content depends on `instance`"""
+        urls = set()
+        if isinstance(instance, BlogPost):
+            urls |= {'/', '/api/blog/', *self.blog_listing_urls()}
+            urls |= self.post_urls([instance])
+            # Posts whose precomputed "Related Posts" list this one
+            urls |= self.post_urls(BlogPost.objects.published().listing_as_related(instance))
+        elif isinstance(instance, Project):
+            urls |= {'/', '/api/projects/', *self.project_listing_urls()}
+            urls |= self.project_urls([instance])
+            urls |= self.project_urls(Project.objects.listing_as_related(instance))
+            linked_posts = BlogPost.objects.published().filter(related_project=instance)
+            if linked_posts.exists():
+                urls |= {*self.blog_listing_urls()} | self.post_urls(linked_posts)
+        elif isinstance(instance, Technology):
+            urls |= {'/', '/api/technologies/', '/api/projects/', *self.project_listing_urls()}
+            urls |= self.project_urls(instance.projects.all())
+            tagged_posts = BlogPost.objects.published().filter(related_technologies=instance)
+            if tagged_posts.exists():
+                urls |= {*self.blog_listing_urls()} | self.post_urls(tagged_posts)
+        elif isinstance(instance, Tag):
+            urls |= {'/api/blog/', *self.blog_listing_urls()}
+            urls |= self.post_urls(instance.blog_posts.all())
+        elif isinstance(instance, Skill):
+            urls |= {'/about/', '/api/skills/'}
+        return urls
+
+    def deletion_urls(self, model):
+        """Exported URLs that may have shown a deleted `model` row
+
+        The row can't be inspected any more (and its relations went without
+        m2m_changed), so every page of the section it could appear on is
+        re-rendered; unchanged files aren't rewritten.
+        """
+        project_pages = {'/', '/api/projects/', *self.project_listing_urls()} | self.project_urls(
+            Project.objects.only('slug')
+        )
+        post_pages = {'/', '/api/blog/', *self.blog_listing_urls()} | self.post_urls(
+            BlogPost.objects.published().only('slug', 'published')
+        )
+        if model is Project:
+            return project_pages | post_pages  # posts link their project
+        if model is BlogPost:
+            return post_pages
+        if model is Technology:
+            return {'/api/technologies/'} | project_pages | post_pages
+        if model is Tag:
+            return post_pages
+        return {'/about/', '/api/skills/'}
+
+    @staticmethod
+    def primary_keys():
+        return {model._meta.label: sorted(model.objects.values_list('pk', flat=True)) for model in EXPORTED_MODELS}
+
+    # ----- rendering -----
+
+    @staticmethod
+    def output_path(url):
+        index = 'index.json' if url.startswith('/api/') else 'index.html'
+        return (url.strip('/') + '/' + index).lstrip('/')
+
+    def fetch(self, url):
+        response = self.client.get(url, secure=self.secure)
+        if response.status_code != 200:
+            raise ExportError(f'{url} returned {response.status_code}')
+        return response
+
+    def render(self, url):
+        parts = url.strip('/').split('/')
+        if len(parts) == 2 and parts[0] == 'api' and parts[1] in API_LISTS:
+            # Follow every cursor page so the file holds the whole list; a list
+            # that fits one page comes out byte for byte as the API served it
+            first = self.fetch(f'{url}?page_size=100')
+            data = first.json()
+            if data['next'] is None:
+                return first.content
+            results = data['results']
+            while data['next']:
+                data = self.fetch(data['next']).json()
+                results.extend(data['results'])
+            return FastJSONRenderer().render({**data, 'previous': None, 'results': results})
+        return self.fetch(url).content
+
+    def write(self, url):
+        """Render `url` to disk; returns False when the file was already current"""
+        path = self.output_dir / self.output_path(url)
+        content = self.render(url)
+        if path.exists() and path.read_bytes() == content:
+            return False
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+        return True
+
+    # ----- manifest -----
+
+    def read_manifest(self):
+        path = self.output_dir / self.MANIFEST
+        if not path.exists():
+            return None
+        manifest = json.loads(path.read_text())
+        manifest['exported_at'] = parse_datetime(manifest['exported_at'])
+        return manifest
+
+    def write_manifest(self, exported_at, urls, primary_keys):
+        manifest = {'exported_at': exported_at.isoformat(), 'urls': sorted(urls), 'pks': primary_keys}
+        (self.output_dir / self.MANIFEST).write_text(json.dumps(manifest, indent=2))
+
+    def remove(self, urls):
+        for url in urls:
+            path = self.output_dir / self.output_path(url)
+            if path.exists():
+                path.unlink()
+
+    # ----- entry points -----
+
+    def export(self, urls):
+        written = []
+        with blog_view_counter.suspended():
+            for url in sorted(urls):
+                if self.write(url):
+                    written.append(url)
+        return written
+
+    def export_all(self):
+        """Render every route; returns (written, removed) URL lists"""
+        started = timezone.now()
+        previous = self.read_manifest()
+        primary_keys = self.primary_keys()
+        urls = self.all_urls()
+        written = self.export(urls)
+        removed = sorted(set(previous['urls']) - urls) if previous else []
+        self.remove(removed)
+        self.write_manifest(started, urls, primary_keys)
+        return written, removed
+
+    def export_changed(self):
+        """Re-render only pages affected by edits since the last export"""
+        previous = self.read_manifest()
+        if previous is None or 'pks' not in previous:
+            return self.export_all()
+        started = timezone.now()
+        since = previous['exported_at']
+        primary_keys = self.primary_keys()
+
+        urls = self.all_urls()
+        removed = sorted(set(previous['urls']) - urls)
+        affected = urls - set(previous['urls'])
+        for model in EXPORTED_MODELS:
+            for instance in model.objects.filter(updated_date__gte=since):
+                affected |= self.affected_urls(instance)
+            # Deleted rows leave no updated_date behind; only their ids are missing
+            if set(previous['pks'].get(model._meta.label, [])) - set(primary_keys[model._meta.label]):
+                affected |= self.deletion_urls(model)
+        if affected or removed:
+            affected.add('/api/snapshot/')
+
+        written = self.export(affected & urls)
+        self.remove(removed)
+        self.write_manifest(started, urls, primary_keys)
+        return written, removed
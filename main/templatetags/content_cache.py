@@ -0,0 +1,43 @@
+from django import template
+
+from main.cache import cache_stats, get_cache, get_timeout, make_key
+
+register = template.Library()
+
+
+class ContentCacheNode(template.Node):
+    def __init__(self, nodelist, name, vary_on):
+        self.nodelist = nodelist
+        self.name = name
+        self.vary_on = vary_on
+
+    def render(self, context):
+        vary_on = [var.resolve(context) for var in self.vary_on]
+        key = make_key('fragment', self.name, *vary_on)
+        cache = get_cache()
+        value = cache.get(key)
+        if value is not None:
+            cache_stats.record('fragment', hit=True)
+            return value
+        cache_stats.record('fragment', hit=False)
+        value = self.nodelist.render(context)
+        cache.set(key, value, get_timeout())
+        return value
+
+
+@register.tag
+def contentcache(parser, token):
+    """Cache a template fragment until site content changes
+
+    Usage::
+
+        {% contentcache "fragment_name" var1 var2 %}...{% endcontentcache %}
+    """
+    bits = token.split_contents()
+    if len(bits) < 2:
+        raise template.TemplateSyntaxError(f"'{bits[0]}' tag requires a fragment name")
+    nodelist = parser.parse(('endcontentcache',))
+    parser.delete_first_token()
+    name = bits[1].strip('"\'')
+    vary_on = [parser.compile_filter(bit) for bit in bits[2:]]
+    return ContentCacheNode(nodelist, name, vary_on)
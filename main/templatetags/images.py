@@ -0,0 +1,43 @@
+from django import template
+
+from main.images import picture_sources
+
+register = template.Library()
+
+
+@register.inclusion_tag('main/picture.html')
+def project_thumbnail(project, sizes='100vw', css_class='', style=''):
+    """<picture> with resized WebP/AVIF sources, falling back to the uploaded file
+
+    Usage::
+
+        {% project_thumbnail project "(min-width: 992px) 33vw, 100vw" "card-img-top" %}
+    """
+    return {
+        'src': project.thumbnail.url,
+        'alt': project.title,
+        'sources': picture_sources(project.thumbnail, project.thumbnail_variants),
+        'sizes': sizes,
+        'css_class': css_class,
+        'style': style,
+    }
+
+
+@register.inclusion_tag('main/picture.html')
+def project_screenshot(screenshot, sizes='100vw', css_class=''):
+    """Lazy-loaded screenshot that keeps its space (and colour) until it arrives
+
+    Width/height reserve the layout box and the average colour paints it,
+    both from the database, so nothing is fetched before the image itself.
+    """
+    style = f'background-color: {screenshot.placeholder};' if screenshot.placeholder else ''
+    return {
+        'src': screenshot.src,
+        'alt': screenshot.caption or 'Screenshot',
+        'sources': picture_sources(screenshot.image, screenshot.variants),
+        'sizes': sizes,
+        'css_class': css_class,
+        'style': style,
+        'width': screenshot.width,
+        'height': screenshot.height,
+    }
@@ -0,0 +1,55 @@
+import time
+
+from django.conf import settings
+from rest_framework.throttling import BaseThrottle
+
+from .cache import get_cache
+
+
+class TokenBucket:
+    """Per-client token bucket kept in the content cache (see main.cache.get_cache)
+
+    A client may burst up to CONTACT_THROTTLE_BURST submissions and then
+    earns one more every CONTACT_THROTTLE_REFILL_SECONDS. The state is a
+    plain get/set, so two simultaneous requests from one client can share
+    a token; that is fine for spam control. With several workers that cache
+    is shared, so the limit applies across them.
+    """
+
+    def __init__(self, scope):
+        self.scope = scope
+
+    @property
+    def capacity(self):
+        return getattr(settings, 'CONTACT_THROTTLE_BURST', 5)
+
+    @property
+    def refill_seconds(self):
+        return getattr(settings, 'CONTACT_THROTTLE_REFILL_SECONDS', 60)
+
+    def consume(self, ident):
+        """Take a token for `ident`; returns (allowed, seconds until the next token)"""
+        cache = get_cache()
+        key = f'throttle:{self.scope}:{ident}'
+        now = time.time()
+        tokens, updated = cache.get(key, (self.capacity, now))
+        tokens = min(self.capacity, tokens + (now - updated) / self.refill_seconds)
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        # Forget the client once the bucket would have refilled completely
+        cache.set(key, (tokens, now), timeout=int(self.capacity * self.refill_seconds) + 1)
+        return allowed, 0 if allowed else (1 - tokens) * self.refill_seconds
+
+
+class ContactRateThrottle(BaseThrottle):
+    """DRF throttle for contact submissions, also used by the HTML contact view"""
+
+    bucket = TokenBucket('contact')
+
+    def allow_request(self, request, view):
+        allowed, self.retry_after = self.bucket.consume(self.get_ident(request))
+        return allowed
+
+    def wait(self):
+        return self.retry_after
@@ -1,12 +1,16 @@
 from django.urls import path
 from . import views
+from .sessions import sessionless
 
+# Public pages never use the session (see SelectiveSessionMiddleware)
 urlpatterns = [
-    path('', views.home, name='home'),
-    path('projects/', views.projects, name='projects'),
-    path('projects/<slug:slug>/', views.project_detail, name='project_detail'),
-    path('blog/', views.blog, name='blog'),
-    path('blog/<slug:slug>/', views.blog_detail, name='blog_detail'),
-    path('about/', views.about, name='about'),
-    path('contact/', views.contact, name='contact'),
+    path('', sessionless(views.home), name='home'),
+    path('projects/', sessionless(views.projects), name='projects'),
+    path('projects/page/<int:page>/', sessionless(views.projects), name='projects_page'),
+    path('projects/<slug:slug>/', sessionless(views.project_detail), name='project_detail'),
+    path('blog/', sessionless(views.blog), name='blog'),
+    path('blog/page/<int:page>/', sessionless(views.blog), name='blog_page'),
+    path('blog/<slug:slug>/', sessionless(views.blog_detail), name='blog_detail'),
+    path('about/', sessionless(views.about), name='about'),
+    path('contact/', sessionless(views.contact), name='contact'),
 ]
\ No newline at end of file
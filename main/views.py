@@ -1,16 +1,33 @@
+import math
+
 from django.shortcuts import render
 
 # Create your views here.
 from django.shortcuts import render, get_object_or_404
 from django.core.paginator import Paginator
-from django.db.models import Q
-from .models import Project, BlogPost, Technology, Skill, Contact
+from django.utils.http import urlencode
+from .models import Project, BlogPost, Technology, Skill
+from .aggregates import category_summary
+from .counters import blog_view_counter
+from .search import get_search_backend
+from .cache import cache_content_page
+from .contact_queue import contact_queue
+from .serializers import ContactSerializer
+from .throttling import ContactRateThrottle
+
+def filter_query(**filters):
+    """Active listing filters as a query string for pagination links"""
+    return urlencode({key: value for key, value in filters.items() if value})
 
+@cache_content_page
 def home(request):
     """Homepage with featured projects and recent blog posts"""
-    featured_projects = Project.objects.filter(featured=True, status='completed')[:3]
-    recent_posts = BlogPost.objects.filter(published=True)[:3]
-    technologies = Technology.objects.all()[:8]  # Show top 8 technologies
+    featured_projects = Project.objects.filter(
+        featured=True, status='completed'
+    ).for_listing()[:3]
+    recent_posts = BlogPost.objects.published().without_bodies()[:3]
+    # Show the 8 technologies used by the most projects (maintained count, no COUNT query)
+    technologies = Technology.objects.order_by('-project_count', 'name')[:8]
     
     context = {
         'featured_projects': featured_projects,
@@ -19,14 +36,15 @@ def home(request):
     }
     return render(request, 'main/home.html', context)
 
-def projects(request):
+@cache_content_page
+def projects(request, page=None):
     """Projects listing page with filtering"""
-    projects_list = Project.objects.all()
+    projects_list = Project.objects.for_listing()
     
-    # Filter by technology if specified
+    # Filter by technology if specified (the dropdown sends lowercased names)
     tech_filter = request.GET.get('technology')
     if tech_filter:
-        projects_list = projects_list.filter(technologies__slug=tech_filter)
+        projects_list = projects_list.filter(technologies__name__iexact=tech_filter)
     
     # Filter by status
     status_filter = request.GET.get('status')
@@ -35,7 +53,7 @@ def projects(request):
     
     # Pagination
     paginator = Paginator(projects_list, 6)  # 6 projects per page
-    page_number = request.GET.get('page')
+    page_number = page or request.GET.get('page')
     projects = paginator.get_page(page_number)
     
     # Get all technologies for filter dropdown
@@ -46,15 +64,15 @@ def projects(request):
         'technologies': technologies,
         'current_tech': tech_filter,
         'current_status': status_filter,
+        'filter_query': filter_query(technology=tech_filter, status=status_filter),
     }
     return render(request, 'main/projects.html', context)
 
+@cache_content_page
 def project_detail(request, slug):
     """Individual project detail page"""
-    project = get_object_or_404(Project, slug=slug)
-    related_projects = Project.objects.filter(
-        technologies__in=project.technologies.all()
-    ).exclude(id=project.id).distinct()[:3]
+    project = get_object_or_404(Project.objects.for_detail(), slug=slug)
+    related_projects = Project.objects.related_to(project)[:3]
     
     context = {
         'project': project,
@@ -62,18 +80,15 @@ def project_detail(request, slug):
     }
     return render(request, 'main/project_detail.html', context)
 
-def blog(request):
+@cache_content_page
+def blog(request, page=None):
     """Blog listing page"""
-    posts_list = BlogPost.objects.filter(published=True)
+    posts_list = BlogPost.objects.published().for_listing()
     
-    # Search functionality
+    # Search functionality (ranked full-text search, see main/search.py)
     search_query = request.GET.get('search')
     if search_query:
-        posts_list = posts_list.filter(
-            Q(title__icontains=search_query) | 
-            Q(content__icontains=search_query) |
-            Q(excerpt__icontains=search_query)
-        )
+        posts_list = get_search_backend().search(posts_list, search_query)
     
     # Filter by category
     category_filter = request.GET.get('category')
@@ -82,33 +97,31 @@ def blog(request):
     
     # Pagination
     paginator = Paginator(posts_list, 5)  # 5 posts per page
-    page_number = request.GET.get('page')
+    page_number = page or request.GET.get('page')
     posts = paginator.get_page(page_number)
     
-    # Get categories for filter
-    categories = BlogPost.objects.values_list('category', flat=True).distinct()
+    # Categories for the filter, with post counts (cached; see main/aggregates.py)
+    categories = category_summary()
     
     context = {
         'posts': posts,
         'categories': categories,
         'search_query': search_query,
         'current_category': category_filter,
+        'filter_query': filter_query(search=search_query, category=category_filter),
     }
     return render(request, 'main/blog.html', context)
 
 def blog_detail(request, slug):
     """Individual blog post detail page"""
-    post = get_object_or_404(BlogPost, slug=slug, published=True)
+    post = get_object_or_404(BlogPost.objects.published().for_detail(), slug=slug)
     
-    # Increment view count
-    post.views += 1
-    post.save(update_fields=['views'])
+    # Buffer the view; counts are written to the database in batches
+    blog_view_counter.record(post.pk)
+    post.views += 1  # display count includes this view
     
-    # Get related posts
-    related_posts = BlogPost.objects.filter(
-        published=True,
-        tags__in=post.tags.all()
-    ).exclude(id=post.id).distinct()[:3]
+    # Ranked related posts from the precomputed index (main/related.py)
+    related_posts = BlogPost.objects.published().related_to(post)[:3]
     
     context = {
         'post': post,
@@ -116,6 +129,7 @@ def blog_detail(request, slug):
     }
     return render(request, 'main/blog_detail.html', context)
 
+@cache_content_page
 def about(request):
     """About page with skills"""
     skills_by_category = {}
@@ -134,19 +148,19 @@ def about(request):
 def contact(request):
     """Contact page with form handling"""
     if request.method == 'POST':
-        # Process contact form
-        name = request.POST.get('name')
-        email = request.POST.get('email')
-        subject = request.POST.get('subject')
-        message = request.POST.get('message')
+        # Per-IP token bucket, shared with the API endpoint
+        throttle = ContactRateThrottle()
+        if not throttle.allow_request(request, None):
+            response = render(request, 'main/contact.html', {'throttled': True}, status=429)
+            response['Retry-After'] = str(math.ceil(throttle.wait()))
+            return response
+        
+        serializer = ContactSerializer(data=request.POST)
+        if not serializer.is_valid():
+            return render(request, 'main/contact.html', {'errors': serializer.errors}, status=400)
         
-        # Save to database
-        contact_submission = Contact.objects.create(
-            name=name,
-            email=email,
-            subject=subject,
-            message=message
-        )
+        # Buffered and saved in batches; notifications run off the request path
+        contact_queue.submit(**serializer.validated_data)
         
         # Success message (we'll add Django messages later)
         return render(request, 'main/contact.html', {'success': True})
@@ -0,0 +1,58 @@
+"""
+Connection management shared by every DATABASES branch in settings.py.
+"""
+
+from django.core.exceptions import ImproperlyConfigured
+
+POSTGRESQL_ENGINE = 'django.db.backends.postgresql'
+
+
+def conn_max_age(value):
+    """decouple cast for DB_CONN_MAX_AGE: seconds, or 'none' for unlimited"""
+    return None if str(value).lower() == 'none' else int(value)
+
+
+def pool_mode(value):
+    """decouple cast for DB_POOL: true/false, or 'auto' to pool whenever PostgreSQL and psycopg_pool are available"""
+    if str(value).lower() == 'auto':
+        return 'auto'
+    return str(value).lower() in ('1', 'true', 'yes', 'on')
+
+
+def pool_available():
+    try:
+        import psycopg_pool  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def configure_connections(database, max_age=60, health_checks=True, pool=False,
+                          pool_min_size=2, pool_max_size=10, pool_timeout=10):
+    """Return `database` with persistent-connection or pool settings applied
+
+    Persistent connections (CONN_MAX_AGE) keep one connection per worker
+    thread open across requests; health checks ping a reused connection
+    before a request relies on it. Alternatively `pool` hands out
+    connections from psycopg 3's pool, which Django can't combine with
+    persistent connections. With pool='auto' the pool is used on
+    PostgreSQL when psycopg_pool is installed, else `max_age` applies.
+    """
+    database = dict(database)
+    database['CONN_HEALTH_CHECKS'] = health_checks
+    if pool == 'auto':
+        pool = database['ENGINE'] == POSTGRESQL_ENGINE and pool_available()
+    if not pool:
+        database['CONN_MAX_AGE'] = max_age
+        return database
+
+    if database['ENGINE'] != POSTGRESQL_ENGINE:
+        raise ImproperlyConfigured('DB_POOL is only supported with PostgreSQL.')
+    if not pool_available():
+        raise ImproperlyConfigured('DB_POOL requires psycopg 3 with its pool: pip install "psycopg[binary,pool]"')
+    database['CONN_MAX_AGE'] = 0
+    database['OPTIONS'] = {
+        **database.get('OPTIONS', {}),
+        'pool': {'min_size': pool_min_size, 'max_size': pool_max_size, 'timeout': pool_timeout},
+    }
+    return database
@@ -0,0 +1,41 @@
+"""
+Gunicorn settings for serving portfolio.asgi with Uvicorn workers.
+
+    gunicorn portfolio.asgi -c python:portfolio.gunicorn_asgi
+
+Each worker runs an event loop, so the async read-only API views keep
+serving other requests while one waits on the database. Sync views and
+middleware still work; Django runs them in a thread per request.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+worker_class = 'uvicorn_worker.UvicornWorker'
+workers = int(os.environ.get('WEB_CONCURRENCY', '2'))
+# Route the read-only API to the async views (see ASYNC_API in settings).
+# Async ORM calls run in short-lived threads, so persistent connections would
+# leak. On PostgreSQL connections come from the psycopg pool instead and are
+# reused across requests; elsewhere (SQLite) each request opens its own.
+# WEB_CONCURRENCY tells settings how many processes share the cache.
+raw_env = [
+    f'WEB_CONCURRENCY={workers}',
+    f"ASYNC_API={os.environ.get('ASYNC_API', 'True')}",
+    f"DB_CONN_MAX_AGE={os.environ.get('DB_CONN_MAX_AGE', '0')}",
+    f"DB_POOL={os.environ.get('DB_POOL', 'auto')}",
+]
+accesslog = '-'
+errorlog = '-'
+
+
+def worker_exit(server, worker):
+    # A worker stopping on SIGTERM (a deploy or restart) saves what it still
+    # buffers; failures are logged by the flushes themselves
+    from main.contact_queue import contact_queue
+    from main.counters import blog_view_counter
+
+    for buffer in (contact_queue, blog_view_counter):
+        try:
+            buffer.flush()
+        except Exception:
+            pass
@@ -1,8 +1,10 @@
 import os
-from decouple import config
+from decouple import Csv, config
 from pathlib import Path
 import dj_database_url
 
+from .database import configure_connections, conn_max_age, pool_mode
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -47,12 +49,17 @@ INSTALLED_APPS = [
     'main',
 ]
 
+# Per-endpoint latency/DB/template metrics and Server-Timing headers
+# (off by default; the middleware unloads itself when disabled)
+PERFORMANCE_METRICS = config('PERFORMANCE_METRICS', default=False, cast=bool)
+
 # Middleware (ENHANCED WITH CORS)
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',  # ADDED - must be first
+    'main.middleware.PerformanceMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
-    'django.contrib.sessions.middleware.SessionMiddleware',
+    'main.middleware.SelectiveSessionMiddleware',  # skips the session for @sessionless views
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
@@ -64,7 +71,10 @@ ROOT_URLCONF = 'portfolio.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'BACKEND': (
+            'main.instrumentation.InstrumentedDjangoTemplates' if PERFORMANCE_METRICS
+            else 'django.template.backends.django.DjangoTemplates'
+        ),
         'DIRS': [BASE_DIR / 'templates'],
         'APP_DIRS': True,
         'OPTIONS': {
@@ -109,6 +119,48 @@ else:
         )
     }
 
+# Connection management, applied the same way whichever branch was taken:
+# DB_CONN_MAX_AGE       seconds a connection is reused across requests (0 = one per
+#                       request, 'none' = forever); keep 0 under ASGI and use the pool
+# DB_CONN_HEALTH_CHECKS ping a reused connection before a request uses it
+# DB_POOL               psycopg 3 connection pool instead (PostgreSQL only); 'auto'
+#                       pools when PostgreSQL and psycopg_pool are available (the
+#                       ASGI default, see portfolio/gunicorn_asgi.py)
+DATABASES['default'] = configure_connections(
+    DATABASES['default'],
+    max_age=config('DB_CONN_MAX_AGE', default=60, cast=conn_max_age),
+    health_checks=config('DB_CONN_HEALTH_CHECKS', default=True, cast=bool),
+    pool=config('DB_POOL', default=False, cast=pool_mode),
+    pool_min_size=config('DB_POOL_MIN_SIZE', default=2, cast=int),
+    pool_max_size=config('DB_POOL_MAX_SIZE', default=10, cast=int),
+    pool_timeout=config('DB_POOL_TIMEOUT', default=10, cast=int),
+)
+
+# Server worker processes (set by portfolio/gunicorn_asgi.py)
+WEB_CONCURRENCY = config('WEB_CONCURRENCY', default=1, cast=int)
+
+# Cache configuration - local memory for a single process; with more workers the
+# database cache by default, so an admin edit invalidates cached pages in all of
+# them (run `manage.py createcachetable`). CACHE_BACKEND/CACHE_LOCATION can point
+# at Redis instead; LocMemCache with several workers fails check main.E002
+CACHES = {
+    'default': {
+        'BACKEND': config('CACHE_BACKEND', default=(
+            'django.core.cache.backends.db.DatabaseCache' if WEB_CONCURRENCY > 1
+            else 'django.core.cache.backends.locmem.LocMemCache'
+        )),
+        'LOCATION': config('CACHE_LOCATION', default='portfolio_cache' if WEB_CONCURRENCY > 1 else 'portfolio'),
+    }
+}
+
+# Rendered pages/fragments are kept until an admin edit invalidates them,
+# or for at most this many seconds
+CONTENT_CACHE_TIMEOUT = config('CONTENT_CACHE_TIMEOUT', default=600, cast=int)
+
+# Listing queries defer long text columns; warn when a template or serializer
+# loads one anyway (an extra query per row). See DeferredFieldGuard in main/models.py
+WARN_DEFERRED_FIELDS = config('WARN_DEFERRED_FIELDS', default=DEBUG, cast=bool)
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -141,10 +193,26 @@ static_dir = BASE_DIR / 'static'
 if static_dir.exists():
     STATICFILES_DIRS.append(static_dir)
 
+# Production static mode: collectstatic writes content-hashed copies with .gz/.br
+# variants and a manifest, and WhiteNoise serves the hashed names with a year-long
+# immutable Cache-Control. Off in development so edits show without collectstatic.
+STATIC_MANIFEST = config('STATIC_MANIFEST', default=False, cast=bool)
+
 # Media files
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Project thumbnails - resized variants (content-hashed names under MEDIA_ROOT) are
+# encoded after upload on a worker pool; add avif if this Pillow build supports it
+THUMBNAIL_WIDTHS = [320, 640, 960, 1280]
+THUMBNAIL_FORMATS = config('THUMBNAIL_FORMATS', default='webp', cast=Csv())
+THUMBNAIL_QUALITY = config('THUMBNAIL_QUALITY', default=80, cast=int)
+THUMBNAIL_BACKGROUND = True
+THUMBNAIL_WORKERS = config('THUMBNAIL_WORKERS', default=2, cast=int)
+
+# Output directory for `manage.py export_static`
+STATIC_EXPORT_ROOT = config('STATIC_EXPORT_ROOT', default=str(BASE_DIR / 'static_export'))
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
@@ -153,13 +221,36 @@ AUTHENTICATION_BACKENDS = [
     'django.contrib.auth.backends.ModelBackend',
 ]
 
-# Session configuration
+# Session configuration - only the admin (and staff API) use sessions: public pages
+# and the read-only API are @sessionless. cached_db reads admin sessions from the
+# cache and only writes the database when a session changes.
+SESSION_ENGINE = config('SESSION_ENGINE', default='django.contrib.sessions.backends.cached_db')
 SESSION_COOKIE_AGE = 86400  # 24 hours
-SESSION_SAVE_EVERY_REQUEST = True
+SESSION_SAVE_EVERY_REQUEST = config('SESSION_SAVE_EVERY_REQUEST', default=False, cast=bool)
 SESSION_EXPIRE_AT_BROWSER_CLOSE = False
 SESSION_COOKIE_SECURE = False
 SESSION_COOKIE_HTTPONLY = True
 
+# Blog view counting - views are buffered per worker and written in batches
+# every N seconds (0 writes on every request); each worker flushes on a timer,
+# on SIGTERM and at exit, so a crash loses at most one interval of views
+BLOG_VIEW_FLUSH_INTERVAL = config('BLOG_VIEW_FLUSH_INTERVAL', default=30, cast=int)
+
+# Contact submissions - per-IP token bucket (burst, then one more every N seconds),
+# buffered and bulk-inserted in batches; notification handlers run in the background
+CONTACT_THROTTLE_BURST = config('CONTACT_THROTTLE_BURST', default=5, cast=int)
+CONTACT_THROTTLE_REFILL_SECONDS = config('CONTACT_THROTTLE_REFILL_SECONDS', default=60, cast=int)
+CONTACT_QUEUE_BATCH_SIZE = config('CONTACT_QUEUE_BATCH_SIZE', default=20, cast=int)
+CONTACT_QUEUE_FLUSH_INTERVAL = config('CONTACT_QUEUE_FLUSH_INTERVAL', default=5, cast=int)
+CONTACT_QUEUE_BACKGROUND = True
+# Email a summary of each saved batch here (needs Django's EMAIL_* settings)
+CONTACT_NOTIFY_EMAIL = config('CONTACT_NOTIFY_EMAIL', default='')
+
+# Related content - each project/post keeps its N best-matching items, refreshed on
+# edits; TF-IDF also relates posts by text similarity (rebuild_related after toggling)
+RELATED_CONTENT_LIMIT = config('RELATED_CONTENT_LIMIT', default=6, cast=int)
+RELATED_CONTENT_TFIDF = config('RELATED_CONTENT_TFIDF', default=False, cast=bool)
+
 # CSRF configuration
 CSRF_COOKIE_SECURE = False
 CSRF_COOKIE_SAMESITE = 'Lax'
@@ -180,10 +271,8 @@ if os.environ.get('RAILWAY_ENVIRONMENT'):
     X_FRAME_OPTIONS = 'SAMEORIGIN'
     SECURE_SSL_REDIRECT = False
     
-    # Static files configuration for Railway
-    STATICFILES_STORAGE = 'django.contrib.staticfiles.storage.StaticFilesStorage'
-    WHITENOISE_USE_FINDERS = True
-    WHITENOISE_AUTOREFRESH = True
+    # Static files configuration for Railway (collectstatic runs at startup)
+    STATIC_MANIFEST = config('STATIC_MANIFEST', default=True, cast=bool)
     
     # Force session settings for admin
     SESSION_COOKIE_DOMAIN = None
@@ -195,6 +284,20 @@ if os.environ.get('RAILWAY_ENVIRONMENT'):
         'django.contrib.staticfiles.finders.AppDirectoriesFinder',
     ]
 
+# Static file storage for the mode chosen above. Without the manifest, WhiteNoise
+# looks files up through the finders on every request so edits are picked up.
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {
+        'BACKEND': (
+            'whitenoise.storage.CompressedManifestStaticFilesStorage' if STATIC_MANIFEST
+            else 'django.contrib.staticfiles.storage.StaticFilesStorage'
+        ),
+    },
+}
+WHITENOISE_USE_FINDERS = not STATIC_MANIFEST
+WHITENOISE_AUTOREFRESH = not STATIC_MANIFEST
+
 # Debug database configuration (only in development)
 if DEBUG and config('DATABASE_URL', default='').startswith('postgresql'):
     print(f"Database Engine: {DATABASES['default']['ENGINE']}")
@@ -206,8 +309,24 @@ if DEBUG and config('DATABASE_URL', default='').startswith('postgresql'):
 REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.AllowAny',
-    ]
+    ],
+    # Keyset (cursor) pagination for every list endpoint; ?page_size= up to 100
+    'DEFAULT_PAGINATION_CLASS': 'main.pagination.KeysetPagination',
+    'PAGE_SIZE': 20,
+    # orjson-backed JSON (same bytes as DRF's renderer) when orjson is installed
+    'DEFAULT_RENDERER_CLASSES': [
+        'main.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    # Proxies in front of the app; throttles key on the X-Forwarded-For entry the
+    # outermost one appended, so clients can't pick their own. Railway has one;
+    # use 0 when serving directly (REMOTE_ADDR only)
+    'NUM_PROXIES': config('NUM_PROXIES', default=1, cast=int),
 }
 
+# Serve the read-only API endpoints from native async views (set by the ASGI
+# start config in portfolio/gunicorn_asgi.py; no benefit under WSGI)
+ASYNC_API = config('ASYNC_API', default=False, cast=bool)
+
 # ===== CORS CONFIGURATION (ADDED) =====
 CORS_ALLOW_ALL_ORIGINS = True  # For development - we'll restrict this later
\ No newline at end of file